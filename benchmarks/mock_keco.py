@@ -0,0 +1,168 @@
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+import json
+import random
+from typing import Any
+
+import httpx
+
+from custom_components.keco_evcharger.const import API_BASE
+
+_STAT_WEIGHTS = (("2", 70), ("3", 20), ("1", 3), ("4", 2), ("5", 2), ("9", 3))
+
+
+def _ts(rng: random.Random) -> str:
+    return (
+        f"2026{rng.randint(1, 12):02d}{rng.randint(1, 28):02d}"
+        f"{rng.randint(0, 23):02d}{rng.randint(0, 59):02d}{rng.randint(0, 59):02d}"
+    )
+
+
+@dataclass
+class MockConfig:
+    zcode: str = "11"
+    stations: int = 2000
+    chargers_per_station: int = 8
+    latency: float = 0.0
+    error_rate: float = 0.0
+    status_change_rate: float = 0.05
+    seed: int = 0
+
+
+# Local stand-in for apis.data.go.kr/B552584/EvCharger: serves paged getChargerInfo
+# and getChargerStatus payloads for one synthetic zone through httpx.MockTransport.
+class MockKecoServer:
+    def __init__(self, config: MockConfig | None = None) -> None:
+        self.config = config or MockConfig()
+        self.requests = 0
+        self._rng = random.Random(self.config.seed)
+        # Initial timestamps are all in 2026; tick() moves a clock forward from here.
+        self._clock = datetime(2027, 1, 1)
+        self._ticks = 0
+        self.rows = self._build_rows()
+        self._by_stat_id: dict[str, list[dict[str, Any]]] = {}
+        for row in self.rows:
+            self._by_stat_id.setdefault(row["statId"], []).append(row)
+
+    @property
+    def stat_ids(self) -> list[str]:
+        return list(self._by_stat_id)
+
+    def _build_rows(self) -> list[dict[str, Any]]:
+        cfg, rng = self.config, self._rng
+        stats, weights = zip(*_STAT_WEIGHTS)
+        rows: list[dict[str, Any]] = []
+        for s in range(cfg.stations):
+            stat_id = f"ME{s:06d}"
+            station = {
+                "statNm": f"테스트 충전소 {s} 공영주차장",
+                "statId": stat_id,
+                "addr": f"서울특별시 강남구 테헤란로 {s % 500}길 {s % 90}",
+                "location": "지하1층",
+                "useTime": "24시간 이용가능",
+                "lat": f"{37.4 + rng.random() * 0.3:.6f}",
+                "lng": f"{126.8 + rng.random() * 0.4:.6f}",
+                "busiId": "ME",
+                "bnm": "환경부",
+                "busiNm": rng.choice(("환경부", "GS차지비", "에버온", "SK일렉링크")),
+                "busiCall": "1661-9408",
+                "zcode": cfg.zcode,
+                "zscode": "11680",
+                "kind": "A0",
+                "kindDetail": "A001",
+                "parkingFree": "Y",
+                "note": "",
+                "limitYn": "N",
+                "limitDetail": "",
+                "delYn": "N",
+                "delDetail": "",
+                "trafficYn": "N",
+            }
+            for c in range(cfg.chargers_per_station):
+                rows.append(
+                    {
+                        **station,
+                        "chgerId": f"{c + 1:02d}",
+                        "chgerType": rng.choice(("01", "04", "06", "07")),
+                        "stat": rng.choices(stats, weights)[0],
+                        "statUpdDt": _ts(rng),
+                        "lastTsdt": _ts(rng),
+                        "lastTedt": _ts(rng),
+                        "nowTsdt": "",
+                        "output": rng.choice(("7", "50", "100", "200")),
+                        "method": "단독",
+                        "powerType": "",
+                    }
+                )
+        return rows
+
+    def tick(self) -> None:
+        # Simulate one poll interval of upstream activity.
+        stats, weights = zip(*_STAT_WEIGHTS)
+        self._ticks += 1
+        self._clock += timedelta(minutes=5)
+        now = self._clock.strftime("%Y%m%d%H%M%S")
+        for row in self.rows:
+            if self._rng.random() < self.config.status_change_rate:
+                row["stat"] = self._rng.choices(stats, weights)[0]
+                row["statUpdDt"] = now
+                row["_changed_tick"] = self._ticks
+
+    def transport(self) -> httpx.MockTransport:
+        return httpx.MockTransport(self._handle)
+
+    def client(self) -> httpx.AsyncClient:
+        return httpx.AsyncClient(transport=self.transport(), timeout=30.0)
+
+    async def _handle(self, request: httpx.Request) -> httpx.Response:
+        self.requests += 1
+        if self.config.latency:
+            await asyncio.sleep(self.config.latency)
+        if self.config.error_rate and self._rng.random() < self.config.error_rate:
+            return httpx.Response(503, text="Service Unavailable")
+
+        path = request.url.path.rsplit("/", 1)[-1]
+        params = request.url.params
+        if not str(request.url).startswith(API_BASE):
+            return httpx.Response(404)
+
+        page_no = int(params.get("pageNo", 1))
+        num_rows = int(params.get("numOfRows", 10))
+        if path == "getChargerInfo":
+            stat_id = params.get("statId")
+            if stat_id:
+                rows = self._by_stat_id.get(stat_id, [])
+            elif params.get("zcode") == self.config.zcode:
+                rows = self.rows
+            else:
+                rows = []
+        elif path == "getChargerStatus":
+            rows = self.rows if params.get("zcode") == self.config.zcode else []
+            if params.get("period"):
+                # Every poll in the benchmarks covers exactly one tick.
+                rows = [r for r in rows if r.get("_changed_tick") == self._ticks]
+            rows = [
+                {k: r[k] for k in ("busiId", "statId", "chgerId", "stat", "statUpdDt", "lastTsdt", "lastTedt", "nowTsdt")}
+                for r in rows
+            ]
+        else:
+            return httpx.Response(404)
+
+        start = (page_no - 1) * num_rows
+        page = [{k: v for k, v in r.items() if not k.startswith("_")} for r in rows[start : start + num_rows]]
+        body = {
+            "resultMsg": "NORMAL SERVICE.",
+            "resultCode": "00",
+            "totalCount": len(rows),
+            "pageNo": page_no,
+            "numOfRows": num_rows,
+            "items": {"item": page},
+        }
+        return httpx.Response(
+            200,
+            content=json.dumps(body, ensure_ascii=False).encode(),
+            headers={"content-type": "application/json;charset=UTF-8"},
+        )
@@ -0,0 +1,296 @@
+"""Offline benchmarks for the KECO integration against MockKecoServer.
+
+Run from the repository root with Home Assistant installed:
+
+    python -m benchmarks.run --stations 1 50 500 --output results.json
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+from dataclasses import replace
+from itertools import islice
+import json
+import platform
+import sys
+import tempfile
+import time
+from types import SimpleNamespace
+from typing import Any
+from uuid import uuid4
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.keco_evcharger import api
+from custom_components.keco_evcharger.api import KecoApiClient
+from custom_components.keco_evcharger.budget import KecoRequestBudget
+from custom_components.keco_evcharger.catalog import KecoStationCatalog
+from custom_components.keco_evcharger.const import (
+    CONF_STAT_ID,
+    CONF_STAT_NM,
+    CONF_STATIONS,
+    CONF_ZCODE,
+    DEFAULT_UPDATE_INTERVAL,
+    MAX_CONCURRENT_REQUESTS,
+    RATE_LIMIT_BURST,
+    RATE_LIMIT_PER_SECOND,
+    ZONE_PAGE_CONCURRENCY,
+    ZONE_PAGE_SIZE,
+)
+from custom_components.keco_evcharger.coordinator import KecoCoordinator
+from custom_components.keco_evcharger.sensor import SENSOR_TYPES, KecoChargerSensor
+from custom_components.keco_evcharger.zone import KecoZonePoller
+
+from .mock_keco import MockConfig, MockKecoServer
+
+SEARCH_QUERIES = ("강남 공영", "테헤란로 12길", "me0001", "환경부 충전소 7", "없는충전소")
+# Inside, at the edge of and outside the mock zone's coordinate box.
+NEARBY_POINTS = ((37.55, 127.0), (37.4, 126.8), (37.9, 127.5))
+
+
+def _result(name: str, seconds: float, **extra: Any) -> dict[str, Any]:
+    return {"name": name, "seconds": round(seconds, 6), **extra}
+
+
+async def bench_search(hass: HomeAssistant, config: MockConfig) -> list[dict[str, Any]]:
+    server = MockKecoServer(config)
+    client = KecoApiClient("bench", http_client=server.client())
+    catalog = KecoStationCatalog(hass)
+    results = []
+
+    started = time.perf_counter()
+    try:
+        found = await catalog.async_search(client, config.zcode, SEARCH_QUERIES[0])
+    except Exception as err:  # noqa: BLE001
+        # Only possible with --error-rate; warm searches need a loaded catalogue.
+        results.append(_result("search.cold", time.perf_counter() - started, requests=server.requests, error=str(err)))
+        await client.async_close()
+        return results
+    results.append(
+        _result("search.cold", time.perf_counter() - started, requests=server.requests, matches=len(found))
+    )
+
+    started = time.perf_counter()
+    for query in SEARCH_QUERIES:
+        await catalog.async_search(client, config.zcode, query)
+    results.append(
+        _result("search.warm", (time.perf_counter() - started) / len(SEARCH_QUERIES), requests=server.requests)
+    )
+
+    started = time.perf_counter()
+    for lat, lng in NEARBY_POINTS:
+        list(islice(await catalog.async_nearest(client, [config.zcode], lat, lng), 10))
+    results.append(
+        _result("search.nearby", (time.perf_counter() - started) / len(NEARBY_POINTS), requests=server.requests)
+    )
+
+    # Fresh catalogue instance: index rebuilt from the Store file, no network.
+    reloaded = KecoStationCatalog(hass)
+    started = time.perf_counter()
+    await reloaded.async_search(client, config.zcode, SEARCH_QUERIES[0])
+    results.append(_result("search.from_store", time.perf_counter() - started, requests=server.requests))
+
+    await client.async_close()
+    return results
+
+
+async def bench_zone_load(config: MockConfig, pages: int) -> list[dict[str, Any]]:
+    # A zone spanning `pages` getChargerInfo pages, loaded one page at a time
+    # (concurrency 1) and with the pages after the first fetched in parallel.
+    server = MockKecoServer(replace(config, stations=pages * ZONE_PAGE_SIZE // config.chargers_per_station))
+    results = []
+    for name, concurrency in (("zone_load.sequential", 1), ("zone_load.concurrent", ZONE_PAGE_CONCURRENCY)):
+        client = KecoApiClient("bench", http_client=server.client())
+        api.ZONE_PAGE_CONCURRENCY = concurrency
+        before = server.requests
+        started = time.perf_counter()
+        try:
+            stations = await client.get_zone_stations(config.zcode)
+        except Exception as err:  # noqa: BLE001
+            results.append(_result(name, time.perf_counter() - started, pages=pages, error=str(err)))
+            continue
+        finally:
+            api.ZONE_PAGE_CONCURRENCY = ZONE_PAGE_CONCURRENCY
+            await client.async_close()
+        results.append(
+            _result(
+                name,
+                time.perf_counter() - started,
+                pages=pages,
+                concurrency=concurrency,
+                requests=server.requests - before,
+                stations=len(stations),
+            )
+        )
+    return results
+
+
+async def bench_coordinators(
+    hass: HomeAssistant, config: MockConfig, stations: int, cycles: int
+) -> list[dict[str, Any]]:
+    server = MockKecoServer(config)
+    client = KecoApiClient("bench", http_client=server.client())
+    poller = KecoZonePoller(client)
+    budget = KecoRequestBudget(client)
+    # One coordinator serves every station of the key, as in the integration.
+    coordinator = KecoCoordinator(hass, client, zone_poller=poller, budget=budget)
+    entry = SimpleNamespace(
+        # Unique per scenario: the saved state Store is keyed by entry_id.
+        entry_id=uuid4().hex,
+        data={
+            CONF_STATIONS: [
+                {CONF_STAT_ID: stat_id, CONF_STAT_NM: stat_id, CONF_ZCODE: config.zcode}
+                for stat_id in server.stat_ids[:stations]
+            ]
+        },
+        options={},
+    )
+    results = []
+
+    started = time.perf_counter()
+    try:
+        views = await coordinator.async_add_entry(entry)
+    except Exception as err:  # noqa: BLE001
+        results.append(_result("coordinator.setup", time.perf_counter() - started, stations=stations, error=str(err)))
+        await client.async_close()
+        return results
+    results.append(
+        _result("coordinator.setup", time.perf_counter() - started, stations=stations, requests=server.requests)
+    )
+
+    for cycle in range(cycles):
+        server.tick()
+        # Age the zone index by one poll interval instead of sleeping.
+        for zcode in list(poller._fetched_at):
+            poller._fetched_at[zcode] -= DEFAULT_UPDATE_INTERVAL
+        before = server.requests
+        started = time.perf_counter()
+        try:
+            coordinator.data = await coordinator._async_update_data()
+            failed = False
+        except Exception:  # noqa: BLE001
+            failed = True
+        elapsed = time.perf_counter() - started
+        results.append(
+            _result(
+                "coordinator.update",
+                elapsed,
+                stations=stations,
+                cycle=cycle,
+                requests=server.requests - before,
+                failures=len(views) if failed else sum(v.consecutive_failures > 0 for v in views),
+                changed_chargers=sum(len(v.changed_chger_ids) for v in views),
+            )
+        )
+
+    sensors = [
+        KecoChargerSensor(
+            coordinator=coordinator,
+            view=view,
+            entry_id="bench",
+            chger_id=chger_id,
+            description=desc,
+        )
+        for view in views
+        for chger_id in view.rows_by_chger_id
+        for desc in SENSOR_TYPES
+    ]
+    started = time.perf_counter()
+    for sensor in sensors:
+        sensor.native_value
+        sensor.extra_state_attributes
+        sensor.device_info
+    results.append(
+        _result("entity.render", time.perf_counter() - started, stations=stations, entities=len(sensors))
+    )
+
+    # Restart: unloading saves the last known rows, so the entry comes back from the
+    # state Store without waiting on the API, which is then polled in the background.
+    await coordinator.async_remove_entry(entry.entry_id)
+    warm = KecoCoordinator(hass, client, zone_poller=KecoZonePoller(client), budget=KecoRequestBudget(client))
+    before = server.requests
+    started = time.perf_counter()
+    await warm.async_add_entry(entry)
+    results.append(
+        _result("coordinator.warm_setup", time.perf_counter() - started, stations=stations, requests=server.requests - before)
+    )
+    if warm.restore_refreshes:
+        started = time.perf_counter()
+        await asyncio.gather(*warm.restore_refreshes)
+        results.append(
+            _result(
+                "coordinator.restore_refresh",
+                time.perf_counter() - started,
+                stations=stations,
+                requests=server.requests - before,
+            )
+        )
+    await warm.async_remove_entry(entry.entry_id)
+
+    await client.async_close()
+    return results
+
+
+async def run(args: argparse.Namespace) -> dict[str, Any]:
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+        config = MockConfig(
+            stations=args.zone_size,
+            chargers_per_station=args.chargers,
+            latency=args.latency,
+            error_rate=args.error_rate,
+            seed=args.seed,
+        )
+        results = await bench_search(hass, config)
+        if args.zone_pages:
+            results.extend(await bench_zone_load(config, args.zone_pages))
+        for stations in args.stations:
+            results.extend(await bench_coordinators(hass, config, min(stations, args.zone_size), args.cycles))
+        await hass.async_stop(force=True)
+
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "orjson": api.orjson is not None,
+            "msgspec": api.msgspec is not None,
+            "zone_size": args.zone_size,
+            "chargers_per_station": args.chargers,
+            "latency": args.latency,
+            "error_rate": args.error_rate,
+            "zone_pages": args.zone_pages,
+            "seed": args.seed,
+            # Every mock request goes through the client's RequestScheduler.
+            "rate_limit": RATE_LIMIT_PER_SECOND,
+            "rate_limit_burst": RATE_LIMIT_BURST,
+            "max_concurrent_requests": MAX_CONCURRENT_REQUESTS,
+        },
+        "results": results,
+    }
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--stations", type=int, nargs="+", default=[1, 50, 500])
+    parser.add_argument("--zone-size", type=int, default=2000, help="stations in the mock zone")
+    parser.add_argument("--chargers", type=int, default=8, help="chargers per station")
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds added to each mock response")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="share of mock responses that are 503")
+    parser.add_argument(
+        "--zone-pages", type=int, default=7, help="getChargerInfo pages of the zone load case (0 skips it)"
+    )
+    parser.add_argument("--cycles", type=int, default=3, help="coordinator update cycles per scenario")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="write JSON here instead of stdout")
+    args = parser.parse_args(argv)
+
+    report = asyncio.run(run(args))
+    text = json.dumps(report, indent=2, ensure_ascii=False)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as fh:
+            fh.write(text + "\n")
+    else:
+        sys.stdout.write(text + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,26 +1,186 @@
 from __future__ import annotations
 
+import asyncio
+import logging
+from typing import Any
+
+from homeassistant import config_entries
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.storage import Store
+from homeassistant.helpers.typing import ConfigType
 
 from .api import KecoApiClient
-from .const import CONF_API_KEY, DOMAIN
+from .budget import KecoRequestBudget
+from .catalog import KecoStationCatalog
+from .const import (
+    CONF_ADDR,
+    CONF_API_KEY,
+    CONF_BUSI_NM,
+    CONF_ENABLED_CHARGERS,
+    CONF_STAT_ID,
+    CONF_STAT_NM,
+    CONF_STATIONS,
+    CONF_ZCODE,
+    DATA_CATALOG,
+    DATA_CLIENTS,
+    DOMAIN,
+    STATE_STORAGE_KEY,
+    STATE_STORAGE_VERSION,
+)
 from .coordinator import KecoCoordinator
+from .history import StationHistory
+from .services import async_setup_services
+from .zone import KecoZonePoller
+
+_LOGGER = logging.getLogger(__name__)
 
 PLATFORMS: list[Platform] = [Platform.SENSOR]
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    async_setup_services(hass)
+    return True
+
+
+@callback
+def async_get_client(hass: HomeAssistant, api_key: str, flow_id: str | None = None) -> KecoApiClient:
+    # One pooled client per API key, shared by every entry and flow using that key.
+    # Entries register in "entries" and flows (by flow_id) in "flows"; the client
+    # (and the key's coordinator) is closed when the last of them is gone.
+    clients: dict[str, dict] = hass.data.setdefault(DOMAIN, {}).setdefault(DATA_CLIENTS, {})
+    slot = clients.get(api_key)
+    if slot is None:
+        client = KecoApiClient(api_key)
+        slot = clients[api_key] = {
+            "client": client,
+            "zone_poller": KecoZonePoller(client),
+            "budget": KecoRequestBudget(client),
+            "entries": set(),
+            "flows": set(),
+        }
+    if flow_id is not None:
+        slot["flows"].add(flow_id)
+    return slot["client"]
+
+
+@callback
+def async_release_flow_client(hass: HomeAssistant, api_key: str, flow_id: str) -> None:
+    """Called when a flow ends (finished or aborted) that used async_get_client."""
+    clients: dict[str, dict] = hass.data.get(DOMAIN, {}).get(DATA_CLIENTS, {})
+    slot = clients.get(api_key)
+    if slot is None or flow_id not in slot["flows"]:
+        return
+    slot["flows"].discard(flow_id)
+    if not slot["entries"] and not slot["flows"]:
+        clients.pop(api_key, None)
+        hass.async_create_task(_async_close_slot(slot))
+
+
+async def _async_close_slot(slot: dict[str, Any]) -> None:
+    if "coordinator" in slot:
+        await slot["coordinator"].async_shutdown()
+    await slot["client"].async_close()
+
+
+@callback
+def async_get_zone_poller(hass: HomeAssistant, api_key: str) -> KecoZonePoller:
+    async_get_client(hass, api_key)
+    return hass.data[DOMAIN][DATA_CLIENTS][api_key]["zone_poller"]
+
+
+@callback
+def async_get_request_budget(hass: HomeAssistant, api_key: str) -> KecoRequestBudget:
+    async_get_client(hass, api_key)
+    return hass.data[DOMAIN][DATA_CLIENTS][api_key]["budget"]
+
+
+@callback
+def async_get_coordinator(hass: HomeAssistant, api_key: str) -> KecoCoordinator:
+    client = async_get_client(hass, api_key)
+    slot = hass.data[DOMAIN][DATA_CLIENTS][api_key]
+    coordinator = slot.get("coordinator")
+    if coordinator is None:
+        # Shared by every entry using the key, so it must not be bound to (and shut
+        # down with) whichever entry happens to be setting up.
+        token = config_entries.current_entry.set(None)
+        try:
+            coordinator = slot["coordinator"] = KecoCoordinator(
+                hass,
+                client,
+                zone_poller=async_get_zone_poller(hass, api_key),
+                budget=async_get_request_budget(hass, api_key),
+            )
+        finally:
+            config_entries.current_entry.reset(token)
+    return coordinator
+
+
+@callback
+def async_key_sensor_owner(hass: HomeAssistant, api_key: str, exclude: str | None = None) -> str | None:
+    """entry_id of the entry that carries the key-wide sensors of `api_key`.
+
+    The key's coordinator and client are shared, so their sensors exist once per
+    key, on the enabled entry with the lowest entry_id (stable across restarts and
+    independent of setup order).
+    """
+    return min(
+        (
+            other.entry_id
+            for other in hass.config_entries.async_entries(DOMAIN)
+            if other.data.get(CONF_API_KEY) == api_key and other.disabled_by is None and other.entry_id != exclude
+        ),
+        default=None,
+    )
+
+
+@callback
+def async_get_catalog(hass: HomeAssistant) -> KecoStationCatalog:
+    # Station data is the same for every API key; only refreshes need a client.
+    data = hass.data.setdefault(DOMAIN, {})
+    catalog = data.get(DATA_CATALOG)
+    if catalog is None:
+        catalog = data[DATA_CATALOG] = KecoStationCatalog(hass)
+    return catalog
+
+
+@callback
+def _async_acquire_client(hass: HomeAssistant, entry: ConfigEntry) -> KecoApiClient:
+    client = async_get_client(hass, entry.data[CONF_API_KEY])
+    hass.data[DOMAIN][DATA_CLIENTS][entry.data[CONF_API_KEY]]["entries"].add(entry.entry_id)
+    return client
+
+
+async def _async_release_client(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    clients: dict[str, dict] = hass.data[DOMAIN].get(DATA_CLIENTS, {})
+    api_key = entry.data[CONF_API_KEY]
+    slot = clients.get(api_key)
+    if slot is None:
+        return
+    slot["entries"].discard(entry.entry_id)
+    if not slot["entries"] and not slot["flows"]:
+        clients.pop(api_key, None)
+        await _async_close_slot(slot)
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     hass.data.setdefault(DOMAIN, {})
 
-    client = KecoApiClient(entry.data[CONF_API_KEY])
-    coordinator = KecoCoordinator.from_entry(hass, entry, client)
-    await coordinator.async_config_entry_first_refresh()
+    client = _async_acquire_client(hass, entry)
+    coordinator = async_get_coordinator(hass, entry.data[CONF_API_KEY])
+    try:
+        views = await coordinator.async_add_entry(entry)
+    except Exception:
+        await _async_release_client(hass, entry)
+        raise
 
     hass.data[DOMAIN][entry.entry_id] = {
         "client": client,
         "coordinator": coordinator,
+        "stations": views,
     }
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
@@ -35,5 +195,64 @@ async def _update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if ok:
-        hass.data[DOMAIN].pop(entry.entry_id, None)
+        data = hass.data[DOMAIN].pop(entry.entry_id, None)
+        if data:
+            await data["coordinator"].async_remove_entry(entry.entry_id)
+        await _async_release_client(hass, entry)
     return ok
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    owner = async_key_sensor_owner(hass, entry.data.get(CONF_API_KEY, ""), exclude=entry.entry_id)
+    if owner is not None and entry.disabled_by is None and entry.entry_id < owner:
+        # The removed entry carried the key-wide sensors; the next one takes them over.
+        hass.async_create_task(hass.config_entries.async_reload(owner))
+    # History files are per statId; keep those of stations another entry still has.
+    in_use = {
+        station.get(CONF_STAT_ID)
+        for other in hass.config_entries.async_entries(DOMAIN)
+        if other.entry_id != entry.entry_id
+        for station in other.data.get(CONF_STATIONS, [])
+    }
+    stat_ids = {station.get(CONF_STAT_ID) for station in entry.data.get(CONF_STATIONS, [])} - in_use
+    await asyncio.gather(
+        Store(hass, STATE_STORAGE_VERSION, f"{STATE_STORAGE_KEY}_{entry.entry_id}").async_remove(),
+        *(StationHistory(hass, stat_id).async_remove() for stat_id in stat_ids if stat_id),
+    )
+
+
+def _legacy_stations(entry: ConfigEntry) -> list[dict[str, Any]]:
+    keys = (CONF_STAT_ID, CONF_STAT_NM, CONF_ADDR, CONF_BUSI_NM, CONF_ZCODE)
+    if entry.data.get(CONF_STAT_ID):
+        return [{key: entry.data.get(key, "") for key in keys}]
+    # Early single-entry prototype kept its stations in options.
+    return [
+        {key: station.get(key, "") for key in keys}
+        for station in (entry.options or {}).get(CONF_STATIONS, [])
+        if station.get(CONF_STAT_ID)
+    ]
+
+
+async def async_migrate_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
+    if entry.version > 3:
+        return False
+
+    if entry.version < 3:
+        # v1/v2 held a single station in data; v3 holds a list of stations and
+        # keys the enabled charger selection by statId.
+        stations = _legacy_stations(entry)
+        options = {k: v for k, v in (entry.options or {}).items() if k != CONF_STATIONS}
+        enabled = options.get(CONF_ENABLED_CHARGERS) or []
+        if isinstance(enabled, list):
+            options[CONF_ENABLED_CHARGERS] = (
+                {stations[0][CONF_STAT_ID]: enabled} if enabled and stations else {}
+            )
+        hass.config_entries.async_update_entry(
+            entry,
+            data={CONF_API_KEY: entry.data.get(CONF_API_KEY, ""), CONF_STATIONS: stations},
+            options=options,
+            version=3,
+        )
+        _LOGGER.debug("Migrated config entry %s to version 3", entry.entry_id)
+
+    return True
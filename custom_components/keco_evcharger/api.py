@@ -1,27 +1,626 @@
 from __future__ import annotations
 
-from typing import Any
+import asyncio
+from bisect import bisect_left
+import heapq
+from itertools import count
+from collections import Counter, OrderedDict
+from dataclasses import dataclass, field
+from datetime import datetime
+from functools import lru_cache, partial
+import json
+import logging
+import math
+import random
+import time
+from typing import Any, AsyncIterator
 
 import httpx
 
-from .const import API_BASE
+from .const import (
+    API_BASE,
+    BREAKER_FAILURE_THRESHOLD,
+    BREAKER_RECOVERY_TIME,
+    EXPORT_PAGE_SIZE,
+    MAX_CONCURRENT_REQUESTS,
+    RATE_LIMIT_BURST,
+    RATE_LIMIT_PER_SECOND,
+    RETRY_ATTEMPTS,
+    RETRY_BACKOFF_BASE,
+    RETRY_BACKOFF_MAX,
+    RESPONSE_CACHE_SIZE,
+    ZONE_PAGE_CONCURRENCY,
+    ZONE_PAGE_SIZE,
+)
+from .models import KST
+
+# Optional decoders. orjson ships with Home Assistant; msgspec, when installed,
+# enables field projection without building the skipped fields at all.
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover
+    msgspec = None
+
+_LOGGER = logging.getLogger(__name__)
+
+# Upper bounds (seconds) of the per-endpoint latency histogram; the last bucket is open.
+LATENCY_BUCKETS = (0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Request priorities for RequestScheduler; lower is served first.
+PRIORITY_POLL = 0
+PRIORITY_INTERACTIVE = 1
+PRIORITY_BULK = 2
+PRIORITY_NAMES = {PRIORITY_POLL: "poll", PRIORITY_INTERACTIVE: "interactive", PRIORITY_BULK: "bulk"}
+
+# getChargerInfo fields used by the station search catalogue.
+STATION_FIELDS = ("statId", "statNm", "addr", "busiNm", "lat", "lng")
+
+
+@lru_cache(maxsize=8)
+def _projected_decoder(fields: tuple[str, ...]) -> Any:
+    # Unknown keys are skipped by the decoder; UNSET keeps absent fields absent.
+    item = msgspec.defstruct(
+        "KecoItem", [(f, Any | msgspec.UnsetType, msgspec.UNSET) for f in fields]
+    )
+    items = msgspec.defstruct("KecoItems", [("item", list[item], msgspec.field(default_factory=list))])
+    page = msgspec.defstruct(
+        "KecoPage",
+        [
+            ("resultCode", Any | msgspec.UnsetType, msgspec.UNSET),
+            ("resultMsg", Any | msgspec.UnsetType, msgspec.UNSET),
+            ("totalCount", Any | msgspec.UnsetType, msgspec.UNSET),
+            ("items", items | msgspec.UnsetType, msgspec.UNSET),
+        ],
+    )
+    return msgspec.json.Decoder(page)
+
+
+def _decode(content: bytes, fields: tuple[str, ...] | None = None) -> dict[str, Any]:
+    if fields is not None and msgspec is not None:
+        try:
+            return msgspec.to_builtins(_projected_decoder(fields).decode(content))
+        except msgspec.ValidationError:
+            # Unexpected shape (e.g. empty `items` sent as ""): decode in full below.
+            pass
+
+    data = orjson.loads(content) if orjson is not None else json.loads(content)
+    if fields is not None:
+        container = data.get("items")
+        items = container.get("item") if isinstance(container, dict) else None
+        if isinstance(items, list):
+            container["item"] = [{f: it[f] for f in fields if f in it} for it in items]
+    return data
+
+
+@dataclass
+class EndpointStats:
+    requests: int = 0
+    errors: int = 0
+    bytes_received: int = 0
+    items: int = 0
+    latency_total: float = 0.0
+    latency_max: float = 0.0
+    latency_buckets: list[int] = field(default_factory=lambda: [0] * (len(LATENCY_BUCKETS) + 1))
+
+    def record(self, latency: float, size: int, items: int | None, ok: bool) -> None:
+        self.requests += 1
+        if not ok:
+            self.errors += 1
+        self.bytes_received += size
+        self.items += items or 0
+        self.latency_total += latency
+        self.latency_max = max(self.latency_max, latency)
+        self.latency_buckets[bisect_left(LATENCY_BUCKETS, latency)] += 1
+
+    def as_dict(self) -> dict[str, Any]:
+        labels = [f"le_{b}" for b in LATENCY_BUCKETS] + ["inf"]
+        pages = self.requests - self.errors
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "bytes_received": self.bytes_received,
+            "items_per_page_avg": round(self.items / pages, 1) if pages else 0.0,
+            "latency_avg": round(self.latency_total / self.requests, 4) if self.requests else 0.0,
+            "latency_max": round(self.latency_max, 4),
+            "latency_histogram": dict(zip(labels, self.latency_buckets)),
+        }
+
+
+@dataclass
+class ClientStats:
+    requests: int = 0
+    coalesced: int = 0
+    retries: int = 0
+    cache_hits: int = 0
+    cache_stale_hits: int = 0
+    connections_opened: int = 0
+    connections_reused: int = 0
+    handshake_time_total: float = 0.0
+    # Quota day (YYYYmmdd, Korea time) of the last request and its request count.
+    day: str = ""
+    day_requests: int = 0
+    result_codes: Counter[str] = field(default_factory=Counter)
+    endpoints: dict[str, EndpointStats] = field(default_factory=dict)
+
+    @property
+    def handshake_time_avg(self) -> float:
+        if not self.connections_opened:
+            return 0.0
+        return self.handshake_time_total / self.connections_opened
+
+    @property
+    def latency_avg(self) -> float:
+        total = sum(e.requests for e in self.endpoints.values())
+        if not total:
+            return 0.0
+        return sum(e.latency_total for e in self.endpoints.values()) / total
+
+    @property
+    def requests_today(self) -> int:
+        # The stored count is yesterday's until the first request after midnight.
+        return self.day_requests if self.day == datetime.now(KST).strftime("%Y%m%d") else 0
+
+    def count_request(self) -> None:
+        self.requests += 1
+        day = datetime.now(KST).strftime("%Y%m%d")
+        if day != self.day:
+            self.day = day
+            self.day_requests = 0
+        self.day_requests += 1
+
+    def endpoint(self, path: str) -> EndpointStats:
+        stats = self.endpoints.get(path)
+        if stats is None:
+            stats = self.endpoints[path] = EndpointStats()
+        return stats
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "requests": self.requests,
+            "requests_today": self.requests_today,
+            "coalesced": self.coalesced,
+            "retries": self.retries,
+            "cache_hits": self.cache_hits,
+            "cache_stale_hits": self.cache_stale_hits,
+            "connections_opened": self.connections_opened,
+            "connections_reused": self.connections_reused,
+            "handshake_time_total": round(self.handshake_time_total, 4),
+            "handshake_time_avg": round(self.handshake_time_avg, 4),
+            "result_codes": dict(self.result_codes),
+            "endpoints": {path: e.as_dict() for path, e in self.endpoints.items()},
+        }
+
+
+@dataclass
+class QueueStats:
+    waits: int = 0
+    queued: int = 0
+    wait_total: float = 0.0
+    wait_max: float = 0.0
+
+    def record(self, wait: float) -> None:
+        self.waits += 1
+        if wait > 0:
+            self.queued += 1
+        self.wait_total += wait
+        self.wait_max = max(self.wait_max, wait)
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "requests": self.waits,
+            "queued": self.queued,
+            "wait_avg": round(self.wait_total / self.waits, 4) if self.waits else 0.0,
+            "wait_max": round(self.wait_max, 4),
+        }
+
+
+# Per API key (one per client): every upstream request attempt takes a token from
+# a bucket refilled at `rate` per second and one of `max_concurrency` slots. When
+# either is exhausted, callers queue and are woken by priority, FIFO within one.
+class RequestScheduler:
+    def __init__(
+        self,
+        rate: float = RATE_LIMIT_PER_SECOND,
+        burst: int = RATE_LIMIT_BURST,
+        max_concurrency: int = MAX_CONCURRENT_REQUESTS,
+    ) -> None:
+        self.rate = rate
+        self.burst = burst
+        self.max_concurrency = max_concurrency
+        self.active = 0
+        self.max_queue_depth = 0
+        self.stats: dict[int, QueueStats] = {}
+        self._tokens = float(burst)
+        self._refilled_at = time.monotonic()
+        # (priority, sequence, future); cancelled waiters stay until popped.
+        self._waiters: list[tuple[int, int, asyncio.Future[None]]] = []
+        self._sequence = count()
+        self._timer: asyncio.TimerHandle | None = None
+
+    @property
+    def queue_depth(self) -> int:
+        return sum(not fut.done() for _, _, fut in self._waiters)
+
+    @property
+    def wait_avg(self) -> float:
+        waits = sum(s.waits for s in self.stats.values())
+        if not waits:
+            return 0.0
+        return sum(s.wait_total for s in self.stats.values()) / waits
+
+    def _take(self) -> bool:
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._refilled_at) * self.rate)
+        self._refilled_at = now
+        if self.active >= self.max_concurrency or self._tokens < 1:
+            return False
+        self._tokens -= 1
+        self.active += 1
+        return True
+
+    def _record(self, priority: int, wait: float) -> None:
+        stats = self.stats.get(priority)
+        if stats is None:
+            stats = self.stats[priority] = QueueStats()
+        stats.record(wait)
+
+    async def acquire(self, priority: int = PRIORITY_POLL) -> None:
+        if not self._waiters and self._take():
+            self._record(priority, 0.0)
+            return
+        fut: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._sequence), fut))
+        self.max_queue_depth = max(self.max_queue_depth, len(self._waiters))
+        started = time.monotonic()
+        self._dispatch()
+        try:
+            await fut
+        except asyncio.CancelledError:
+            if fut.done() and not fut.cancelled():
+                # Granted just before the caller was cancelled: hand the slot on.
+                self.release()
+            else:
+                fut.cancel()
+                self._dispatch()
+            raise
+        self._record(priority, time.monotonic() - started)
+
+    def release(self) -> None:
+        self.active -= 1
+        self._dispatch()
+
+    def _dispatch(self) -> None:
+        while self._waiters:
+            fut = self._waiters[0][2]
+            if fut.done():
+                heapq.heappop(self._waiters)
+                continue
+            if not self._take():
+                break
+            heapq.heappop(self._waiters)
+            fut.set_result(None)
+        if self._waiters and self._timer is None and self.active < self.max_concurrency:
+            # Out of tokens: wake up when the next one is due. Otherwise release() dispatches.
+            delay = max(0.0, (1 - self._tokens) / self.rate)
+            self._timer = asyncio.get_running_loop().call_later(delay, self._on_timer)
+
+    def _on_timer(self) -> None:
+        self._timer = None
+        self._dispatch()
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "rate": self.rate,
+            "burst": self.burst,
+            "max_concurrency": self.max_concurrency,
+            "active": self.active,
+            "queue_depth": self.queue_depth,
+            "max_queue_depth": self.max_queue_depth,
+            "priorities": {PRIORITY_NAMES.get(p, str(p)): s.as_dict() for p, s in sorted(self.stats.items())},
+        }
+
+
+class CircuitOpenError(RuntimeError):
+    """Upstream calls are suspended after repeated transient failures."""
+
+
+def _is_transient(err: Exception) -> bool:
+    if isinstance(err, httpx.HTTPStatusError):
+        return err.response.status_code >= 500 or err.response.status_code == 429
+    # Timeouts, connection errors and protocol errors.
+    return isinstance(err, httpx.TransportError)
+
+
+# Per API key (one per client): after BREAKER_FAILURE_THRESHOLD requests in a row
+# fail transiently, every caller fails fast until BREAKER_RECOVERY_TIME has passed.
+# Then a single probe request decides whether to close or re-open.
+class CircuitBreaker:
+    def __init__(
+        self,
+        failure_threshold: int = BREAKER_FAILURE_THRESHOLD,
+        recovery_time: float = BREAKER_RECOVERY_TIME,
+    ) -> None:
+        self.failure_threshold = failure_threshold
+        self.recovery_time = recovery_time
+        self.failures = 0
+        self.trips = 0
+        self.short_circuited = 0
+        self._opened_at: float | None = None
+        self._probing = False
+
+    @property
+    def state(self) -> str:
+        if self._opened_at is None:
+            return "closed"
+        if self._probing or time.monotonic() - self._opened_at >= self.recovery_time:
+            return "half_open"
+        return "open"
+
+    def before_request(self) -> bool:
+        """Raise while open; return True if the caller is the half-open probe."""
+        if self._opened_at is None:
+            return False
+        if self._probing or time.monotonic() - self._opened_at < self.recovery_time:
+            self.short_circuited += 1
+            raise CircuitOpenError("KECO API temporarily suspended after repeated failures")
+        self._probing = True
+        return True
+
+    def record(self, success: bool | None, probe: bool) -> None:
+        # success=None: the request was cancelled and says nothing about upstream.
+        if probe:
+            self._probing = False
+        if success is None:
+            return
+        if success:
+            self.failures = 0
+            self._opened_at = None
+            return
+        self.failures += 1
+        if probe or (self._opened_at is None and self.failures >= self.failure_threshold):
+            self._opened_at = time.monotonic()
+            self.trips += 1
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "state": self.state,
+            "consecutive_failures": self.failures,
+            "trips": self.trips,
+            "short_circuited": self.short_circuited,
+        }
 
 
 class KecoApiClient:
-    def __init__(self, api_key: str, timeout: float = 12.0) -> None:
+    def __init__(
+        self,
+        api_key: str,
+        timeout: float = 12.0,
+        http_client: httpx.AsyncClient | None = None,
+    ) -> None:
         self._api_key = api_key
         self._timeout = timeout
+        # One pooled client per API key (see __init__._async_acquire_client).
+        # Keep-alive avoids a new TCP+TLS handshake to apis.data.go.kr per poll.
+        self._http = http_client
+        self._owns_http = http_client is None
+        self._closed = False
+        # Identical in-flight requests share one task; see _fetch().
+        self._inflight: dict[tuple[Any, ...], asyncio.Task[dict[str, Any]]] = {}
+        self.stats = ClientStats()
+        self.breaker = CircuitBreaker()
+        self.scheduler = RequestScheduler()
+        # Set by the key's coordinator (profiling.KecoProfiler); spans are only
+        # recorded while it is enabled.
+        self.profiler: Any = None
+        # (path, fields, params) -> (monotonic fetch time, payload); LRU, small
+        # payloads only (callers opt in with cache=True).
+        self._cache: OrderedDict[tuple[Any, ...], tuple[float, dict[str, Any]]] = OrderedDict()
+        self._revalidating: set[asyncio.Task[Any]] = set()
+
+    @property
+    def api_key(self) -> str:
+        return self._api_key
+
+    def _http_client(self) -> httpx.AsyncClient:
+        if self._closed:
+            # A task still holding a released client (e.g. a catalogue refresh started
+            # from a finished flow) must not open a transport nobody would close.
+            raise RuntimeError("KECO API client is closed")
+        if self._http is None:
+            self._http = httpx.AsyncClient(
+                timeout=self._timeout,
+                limits=httpx.Limits(max_connections=8, max_keepalive_connections=4, keepalive_expiry=60.0),
+            )
+        return self._http
+
+    async def async_close(self) -> None:
+        self._closed = True
+        for task in (*self._revalidating, *self._inflight.values()):
+            task.cancel()
+        if self._http is not None and self._owns_http:
+            await self._http.aclose()
+        self._http = None
+
+    async def _request(
+        self,
+        path: str,
+        query: dict[str, Any],
+        fields: tuple[str, ...] | None = None,
+        priority: int = PRIORITY_POLL,
+    ) -> dict[str, Any]:
+        probe = self.breaker.before_request()
+        attempt = 0
+        try:
+            while True:
+                try:
+                    payload = await self._send(path, query, fields, priority)
+                except Exception as err:
+                    transient = _is_transient(err)
+                    # A half-open probe gets exactly one attempt.
+                    if transient and not probe and attempt + 1 < RETRY_ATTEMPTS:
+                        attempt += 1
+                        self.stats.retries += 1
+                        # Exponential backoff with full jitter.
+                        await asyncio.sleep(random.uniform(0, min(RETRY_BACKOFF_MAX, RETRY_BACKOFF_BASE * 2**attempt)))
+                        continue
+                    self.breaker.record(not transient, probe)
+                    raise
+                self.breaker.record(True, probe)
+                return payload
+        except asyncio.CancelledError:
+            self.breaker.record(None, probe)
+            raise
+
+    async def _send(
+        self,
+        path: str,
+        query: dict[str, Any],
+        fields: tuple[str, ...] | None = None,
+        priority: int = PRIORITY_POLL,
+    ) -> dict[str, Any]:
+        trace_state = {"new_conn": False, "t0": None}
+
+        async def trace(event: str, info: dict[str, Any]) -> None:
+            if event == "connection.connect_tcp.started":
+                trace_state["t0"] = time.monotonic()
+            elif event in ("connection.connect_tcp.complete", "connection.start_tls.complete"):
+                if event == "connection.connect_tcp.complete":
+                    trace_state["new_conn"] = True
+                    self.stats.connections_opened += 1
+                t0 = trace_state["t0"]
+                if t0 is not None:
+                    now = time.monotonic()
+                    self.stats.handshake_time_total += now - t0
+                    trace_state["t0"] = now
+
+        # Every attempt (retries included) waits its turn; backoff sleeps hold no slot.
+        queued = time.monotonic()
+        await self.scheduler.acquire(priority)
+        self.stats.count_request()
+        endpoint = self.stats.endpoint(path)
+        started = time.monotonic()
+        try:
+            resp = await self._http_client().get(
+                f"{API_BASE}/{path}",
+                params=query,
+                extensions={"trace": trace},
+            )
+        except httpx.HTTPError:
+            endpoint.record(time.monotonic() - started, 0, None, ok=False)
+            raise
+        finally:
+            self.scheduler.release()
+        if not trace_state["new_conn"]:
+            self.stats.connections_reused += 1
+        latency = time.monotonic() - started
+        if resp.is_error:
+            endpoint.record(latency, len(resp.content), None, ok=False)
+            self.stats.result_codes[f"http_{resp.status_code}"] += 1
+        resp.raise_for_status()
+
+        profiler = self.profiler
+        if profiler is not None and profiler.enabled:
+            profiler.add("queue", started - queued)
+            profiler.add(f"http.{path}", latency)
+            payload = profiler.timed("decode", _decode, resp.content, fields)
+        else:
+            payload = _decode(resp.content, fields)
+        container = payload.get("items")
+        items = container.get("item") if isinstance(container, dict) else None
+        code = str(payload.get("resultCode", ""))
+        endpoint.record(latency, len(resp.content), len(items) if isinstance(items, list) else 0, ok=code in ("", "00"))
+        self.stats.result_codes[code or "none"] += 1
+        return payload
+
+    async def _get(
+        self,
+        path: str,
+        fields: tuple[str, ...] | None = None,
+        *,
+        cache: bool = False,
+        max_age: float = 0.0,
+        stale_ok: bool = False,
+        priority: int = PRIORITY_POLL,
+        **params: Any,
+    ) -> dict[str, Any]:
+        # `fields` projects items to those keys; the rest of each item is discarded
+        # while decoding (or right after it, without msgspec).
+        # With `cache`, successful responses are kept and reused for `max_age` seconds.
+        # `stale_ok` returns an older cached response at once and refreshes it in the
+        # background (stale-while-revalidate, for UI dialogs).
+        # `priority` orders the request in the key's RequestScheduler queue.
+        key = (path, fields, tuple(sorted((k, str(v)) for k, v in params.items())))
+        if cache:
+            cached = self._cache.get(key)
+            if cached is not None:
+                fetched_at, payload = cached
+                self._cache.move_to_end(key)
+                if time.monotonic() - fetched_at < max_age:
+                    self.stats.cache_hits += 1
+                    return payload
+                if stale_ok:
+                    self.stats.cache_stale_hits += 1
+                    task = asyncio.get_running_loop().create_task(self._revalidate(key, path, fields, params, priority))
+                    self._revalidating.add(task)
+                    task.add_done_callback(self._revalidating.discard)
+                    return payload
+
+        payload = await self._fetch(key, path, fields, params, priority)
+        if cache:
+            self._cache_store(key, payload)
+        return payload
+
+    def _cache_store(self, key: tuple[Any, ...], payload: dict[str, Any]) -> None:
+        self._cache[key] = (time.monotonic(), payload)
+        self._cache.move_to_end(key)
+        while len(self._cache) > RESPONSE_CACHE_SIZE:
+            self._cache.popitem(last=False)
+
+    async def _revalidate(
+        self,
+        key: tuple[Any, ...],
+        path: str,
+        fields: tuple[str, ...] | None,
+        params: dict[str, Any],
+        priority: int,
+    ) -> None:
+        try:
+            payload = await self._fetch(key, path, fields, params, priority)
+        except Exception as err:  # noqa: BLE001
+            _LOGGER.debug("Background refresh of %s failed: %s", path, err)
+            return
+        self._cache_store(key, payload)
 
-    async def _get(self, path: str, **params: Any) -> dict[str, Any]:
+    async def _fetch(
+        self,
+        key: tuple[Any, ...],
+        path: str,
+        fields: tuple[str, ...] | None,
+        params: dict[str, Any],
+        priority: int = PRIORITY_POLL,
+    ) -> dict[str, Any]:
         query = {
             "serviceKey": self._api_key,
             "dataType": "JSON",
             **params,
         }
-        async with httpx.AsyncClient(timeout=self._timeout) as client:
-            resp = await client.get(f"{API_BASE}/{path}", params=query)
-            resp.raise_for_status()
-            payload = resp.json()
+
+        # Coalesce identical in-flight requests: every caller awaits one shared task.
+        # The task belongs to the _inflight entry, not to the caller that started it,
+        # so a cancelled caller only stops waiting and the others still get the result.
+        task = self._inflight.get(key)
+        if task is not None:
+            self.stats.coalesced += 1
+        else:
+            task = asyncio.get_running_loop().create_task(self._request(path, query, fields, priority))
+            self._inflight[key] = task
+            task.add_done_callback(partial(self._inflight_done, key))
+        payload = await asyncio.shield(task)
 
         code = str(payload.get("resultCode", ""))
         if code and code != "00":
@@ -29,49 +628,163 @@ class KecoApiClient:
             raise RuntimeError(f"KECO API error {code}: {msg}")
         return payload
 
-    async def validate_key(self) -> None:
-        await self._get("getChargerInfo", pageNo=1, numOfRows=1, zcode="11")
+    def _inflight_done(self, key: tuple[Any, ...], task: asyncio.Task[dict[str, Any]]) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            # Mark retrieved so a request whose callers all went away does not log.
+            task.exception()
 
-    async def search_stations(self, query: str, zcode: str = "11") -> list[dict[str, Any]]:
-        # Public API has no keyword endpoint. Fetch multiple pages and filter locally.
-        terms = [t.strip().lower() for t in (query or "").split() if t.strip()]
-        if not terms:
-            return []
+    async def validate_key(self) -> None:
+        await self._get("getChargerInfo", priority=PRIORITY_INTERACTIVE, pageNo=1, numOfRows=1, zcode="11")
 
+    async def get_zone_stations(self, zcode: str = "11") -> list[dict[str, Any]]:
+        # Public API has no keyword endpoint. Fetch the zone's stations for local search
+        # (see catalog.KecoStationCatalog); getChargerInfo rows are per charger.
         seen: set[str] = set()
         out: list[dict[str, Any]] = []
 
         max_pages = 12
         page_size = 9999
 
-        for page_no in range(1, max_pages + 1):
-            data = await self._get("getChargerInfo", pageNo=page_no, numOfRows=page_size, zcode=zcode)
-            items = data.get("items", {}).get("item", []) or []
-            if not items:
-                break
-
-            for it in items:
+        def collect(data: dict[str, Any]) -> None:
+            for it in data.get("items", {}).get("item", []) or []:
                 stat_id = (it.get("statId") or "").strip()
-                stat_nm = (it.get("statNm") or "").strip()
-                addr = (it.get("addr") or "").strip()
-                busi_nm = (it.get("busiNm") or "").strip()
                 if not stat_id or stat_id in seen:
                     continue
+                seen.add(stat_id)
+                out.append(
+                    {
+                        "statId": stat_id,
+                        "statNm": (it.get("statNm") or "").strip(),
+                        "addr": (it.get("addr") or "").strip(),
+                        "busiNm": (it.get("busiNm") or "").strip(),
+                        "lat": str(it.get("lat") or "").strip(),
+                        "lng": str(it.get("lng") or "").strip(),
+                    }
+                )
+
+        started = time.monotonic()
+        first = await self._get(
+            "getChargerInfo",
+            fields=STATION_FIELDS,
+            priority=PRIORITY_BULK,
+            pageNo=1,
+            numOfRows=page_size,
+            zcode=zcode,
+        )
+        collect(first)
+
+        # totalCount on the first page fixes the page count; the rest are fetched in
+        # parallel and merged as each one arrives.
+        total = int(first.get("totalCount") or 0)
+        pages = min(max_pages, math.ceil(total / page_size))
+        semaphore = asyncio.Semaphore(ZONE_PAGE_CONCURRENCY)
 
-                hay = f"{stat_nm} {addr} {busi_nm} {stat_id}".lower()
-                if all(term in hay for term in terms):
-                    seen.add(stat_id)
-                    out.append(
-                        {
-                            "statId": stat_id,
-                            "statNm": stat_nm,
-                            "addr": addr,
-                            "busiNm": busi_nm,
-                        }
-                    )
+        async def fetch(page_no: int) -> dict[str, Any]:
+            async with semaphore:
+                return await self._get(
+                    "getChargerInfo",
+                    fields=STATION_FIELDS,
+                    priority=PRIORITY_BULK,
+                    pageNo=page_no,
+                    numOfRows=page_size,
+                    zcode=zcode,
+                )
 
+        tasks = [asyncio.ensure_future(fetch(page_no)) for page_no in range(2, pages + 1)]
+        try:
+            for fut in asyncio.as_completed(tasks):
+                collect(await fut)
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        _LOGGER.debug(
+            "Fetched %s pages (%s stations) for zcode %s in %.2fs",
+            max(pages, 1),
+            len(out),
+            zcode,
+            time.monotonic() - started,
+        )
         return out
 
-    async def get_station_chargers(self, stat_id: str) -> list[dict[str, Any]]:
-        data = await self._get("getChargerInfo", pageNo=1, numOfRows=200, statId=stat_id)
+    async def get_station_chargers(
+        self,
+        stat_id: str,
+        cache: bool = False,
+        max_age: float = 0.0,
+        stale_ok: bool = False,
+        priority: int = PRIORITY_POLL,
+    ) -> list[dict[str, Any]]:
+        data = await self._get(
+            "getChargerInfo",
+            cache=cache,
+            max_age=max_age,
+            stale_ok=stale_ok,
+            priority=priority,
+            pageNo=1,
+            numOfRows=200,
+            statId=stat_id,
+        )
         return data.get("items", {}).get("item", []) or []
+
+    async def iter_zone_chargers(
+        self, zcode: str, start_page: int = 1, page_size: int = EXPORT_PAGE_SIZE
+    ) -> AsyncIterator[tuple[int, int, list[dict[str, Any]]]]:
+        """Yield (page_no, pages, rows) for every getChargerInfo page of a zone.
+
+        Rows are passed through unprojected. Only the current page and the next one
+        (prefetched while the caller handles the current) are held, whatever the
+        zone size. `start_page` continues an interrupted walk.
+        """
+
+        def fetch(page_no: int) -> asyncio.Future[dict[str, Any]]:
+            return asyncio.ensure_future(
+                self._get(
+                    "getChargerInfo", priority=PRIORITY_BULK, pageNo=page_no, numOfRows=page_size, zcode=zcode
+                )
+            )
+
+        page_no = start_page
+        pending: asyncio.Future[dict[str, Any]] | None = fetch(page_no)
+        try:
+            while pending is not None:
+                data = await pending
+                pending = None
+                items = data.get("items", {}).get("item", []) or []
+                pages = math.ceil(int(data.get("totalCount") or 0) / page_size)
+                if not items:
+                    return
+                if page_no < pages:
+                    pending = fetch(page_no + 1)
+                yield page_no, pages, items
+                page_no += 1
+        finally:
+            if pending is not None:
+                pending.cancel()
+                await asyncio.gather(pending, return_exceptions=True)
+
+    async def get_zone_status_count(self, zcode: str) -> int:
+        # totalCount of the zone's full getChargerStatus feed, from a one-row page.
+        data = await self._get("getChargerStatus", pageNo=1, numOfRows=1, zcode=zcode)
+        return int(data.get("totalCount") or 0)
+
+    async def get_zone_status(self, zcode: str, period: int | None = None) -> list[dict[str, Any]]:
+        # getChargerStatus rows only carry statId/chgerId/stat and timestamps.
+        # With `period` (minutes) only chargers whose status changed in that window are returned.
+        params: dict[str, Any] = {"zcode": zcode}
+        if period:
+            params["period"] = period
+        out: list[dict[str, Any]] = []
+        page_no = 1
+        while True:
+            data = await self._get("getChargerStatus", pageNo=page_no, numOfRows=ZONE_PAGE_SIZE, **params)
+            items = data.get("items", {}).get("item", []) or []
+            out.extend(items)
+            total = int(data.get("totalCount") or 0)
+            if not items or len(out) >= total:
+                break
+            page_no += 1
+        return out
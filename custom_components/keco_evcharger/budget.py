@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+
+from .api import KecoApiClient
+from .const import DEFAULT_DAILY_REQUEST_BUDGET
+from .models import KST
+
+
+# Shared per API key: spreads what is left of the key's daily request quota over
+# the rest of the day, as a lower bound on the key's coordinator poll interval.
+# Config entries register their budget option; the strictest one applies.
+class KecoRequestBudget:
+    def __init__(self, client: KecoApiClient) -> None:
+        self.client = client
+        self._budgets: dict[object, int] = {}
+
+    def register(self, consumer: object, daily_budget: int) -> None:
+        self._budgets[consumer] = max(1, int(daily_budget))
+
+    def unregister(self, consumer: object) -> None:
+        self._budgets.pop(consumer, None)
+
+    @property
+    def daily_budget(self) -> int:
+        # Entries may carry different options for the same key; the strictest wins.
+        return min(self._budgets.values(), default=DEFAULT_DAILY_REQUEST_BUDGET)
+
+    def min_interval(self, requests_per_cycle: int = 1) -> float:
+        remaining = self.daily_budget - self.client.stats.requests_today
+        now = datetime.now(KST)
+        midnight = (now + timedelta(days=1)).replace(hour=0, minute=0, second=0, microsecond=0)
+        seconds_left = (midnight - now).total_seconds()
+        if remaining <= 0:
+            return seconds_left
+        return seconds_left * max(1, requests_per_cycle) / remaining
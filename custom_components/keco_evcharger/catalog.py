@@ -0,0 +1,239 @@
+from __future__ import annotations
+
+import asyncio
+import heapq
+import logging
+import math
+import time
+from typing import Iterator
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+
+from .api import KecoApiClient
+from .const import (
+    CATALOG_STORAGE_KEY,
+    CATALOG_STORAGE_VERSION,
+    CATALOG_TTL,
+    CATALOG_GRID_DEG,
+    CONF_ADDR,
+    CONF_BUSI_NM,
+    CONF_STAT_ID,
+    CONF_STAT_NM,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+# Stored rows are positional lists to keep the store file small.
+_FIELDS = (CONF_STAT_ID, CONF_STAT_NM, CONF_ADDR, CONF_BUSI_NM, "lat", "lng")
+_LAT, _LNG = 4, 5
+
+_EARTH_KM = 6371.0
+_KM_PER_DEG = math.pi * _EARTH_KM / 180
+
+
+def distance_km(lat1: float, lng1: float, lat2: float, lng2: float) -> float:
+    # Haversine; plenty precise at city scale.
+    p1, p2 = math.radians(lat1), math.radians(lat2)
+    a = math.sin((p2 - p1) / 2) ** 2 + math.cos(p1) * math.cos(p2) * math.sin(math.radians(lng2 - lng1) / 2) ** 2
+    return 2 * _EARTH_KM * math.asin(math.sqrt(a))
+
+
+def _coords(row: list[str]) -> tuple[float, float] | None:
+    try:
+        lat, lng = float(row[_LAT]), float(row[_LNG])
+    except (IndexError, ValueError):
+        return None
+    # Korea only; anything else is a placeholder (upstream sends 0 for unknown).
+    if not (33.0 <= lat <= 39.0 and 124.0 <= lng <= 132.0):
+        return None
+    return lat, lng
+
+
+def _bigrams(text: str) -> set[str]:
+    return {text[i : i + 2] for i in range(len(text) - 1) if " " not in text[i : i + 2]}
+
+
+class _ZoneCatalog:
+    def __init__(self, rows: list[list[str]], fetched_at: float) -> None:
+        self.rows = rows
+        self.fetched_at = fetched_at
+        self.hay = [f"{r[1]} {r[2]} {r[3]} {r[0]}".lower() for r in rows]
+        # Character bigram -> row positions. Search terms are substrings without
+        # spaces, so every bigram of a term must appear in a matching row.
+        self.index: dict[str, set[int]] = {}
+        for pos, hay in enumerate(self.hay):
+            for gram in _bigrams(hay):
+                self.index.setdefault(gram, set()).add(pos)
+        # Uniform lat/lng grid (CATALOG_GRID_DEG cells) -> row positions.
+        self.coords = [_coords(row) for row in rows]
+        self.grid: dict[tuple[int, int], list[int]] = {}
+        for pos, coords in enumerate(self.coords):
+            if coords is not None:
+                self.grid.setdefault(_cell(*coords), []).append(pos)
+        rows_i = [i for i, _ in self.grid]
+        cols_j = [j for _, j in self.grid]
+        self._bounds = (min(rows_i), max(rows_i), min(cols_j), max(cols_j)) if self.grid else None
+
+    def search(self, terms: list[str]) -> list[dict[str, str]]:
+        candidates: set[int] | None = None
+        for term in terms:
+            for gram in _bigrams(term):
+                postings = self.index.get(gram)
+                if not postings:
+                    return []
+                candidates = set(postings) if candidates is None else candidates & postings
+                if not candidates:
+                    return []
+
+        positions = range(len(self.rows)) if candidates is None else sorted(candidates)
+        return [
+            dict(zip(_FIELDS, self.rows[pos]))
+            for pos in positions
+            if all(term in self.hay[pos] for term in terms)
+        ]
+
+    def _rings(self, lat: float, lng: float) -> Iterator[tuple[int, list[int]]]:
+        # Row positions ring by ring (Chebyshev distance in cells) around the point.
+        if self._bounds is None:
+            return
+        ci, cj = _cell(lat, lng)
+        min_i, max_i, min_j, max_j = self._bounds
+        # Rings that do not reach the occupied bounding box are skipped.
+        first = max(min_i - ci, ci - max_i, min_j - cj, cj - max_j, 0)
+        last = max(ci - min_i, max_i - ci, cj - min_j, max_j - cj, 0)
+        for r in range(first, last + 1):
+            found: list[int] = []
+            for i in range(max(ci - r, min_i), min(ci + r, max_i) + 1):
+                if i in (ci - r, ci + r):
+                    columns = range(max(cj - r, min_j), min(cj + r, max_j) + 1)
+                else:
+                    columns = (cj - r, cj + r) if r else (cj,)
+                for j in columns:
+                    found.extend(self.grid.get((i, j), ()))
+            yield r, found
+
+    def nearest(self, lat: float, lng: float, max_km: float | None = None) -> Iterator[tuple[float, dict[str, str]]]:
+        """Stations by increasing distance, lazily: callers may stop at any point.
+
+        Rows beyond ring r of the point's cell are at least r cells away, so a
+        candidate closer than that is final before wider rings are read.
+        """
+        # Shortest cell side in km (longitude degrees shrink northwards), with margin.
+        cell_km = CATALOG_GRID_DEG * _KM_PER_DEG * math.cos(math.radians(min(89.0, abs(lat) + 1.0))) * 0.99
+        heap: list[tuple[float, int]] = []
+        for r, positions in self._rings(lat, lng):
+            for pos in positions:
+                plat, plng = self.coords[pos]
+                heapq.heappush(heap, (distance_km(lat, lng, plat, plng), pos))
+            bound = r * cell_km
+            if max_km is not None:
+                bound = min(bound, max_km)
+            while heap and heap[0][0] <= bound:
+                dist, pos = heapq.heappop(heap)
+                yield dist, dict(zip(_FIELDS, self.rows[pos]))
+            if max_km is not None and bound >= max_km:
+                return
+        while heap:
+            dist, pos = heapq.heappop(heap)
+            if max_km is not None and dist > max_km:
+                return
+            yield dist, dict(zip(_FIELDS, self.rows[pos]))
+
+
+def _cell(lat: float, lng: float) -> tuple[int, int]:
+    return math.floor(lat / CATALOG_GRID_DEG), math.floor(lng / CATALOG_GRID_DEG)
+
+
+# Shared by all flows: per-zcode station list persisted through Store, searched
+# locally. A stale zone is still answered from disk and refreshed in the background.
+class KecoStationCatalog:
+    def __init__(self, hass: HomeAssistant) -> None:
+        self.hass = hass
+        self._zones: dict[str, _ZoneCatalog] = {}
+        self._stores: dict[str, Store] = {}
+        self._locks: dict[str, asyncio.Lock] = {}
+        self._refreshing: set[str] = set()
+
+    def _store(self, zcode: str) -> Store:
+        store = self._stores.get(zcode)
+        if store is None:
+            store = self._stores[zcode] = Store(
+                self.hass, CATALOG_STORAGE_VERSION, f"{CATALOG_STORAGE_KEY}_{zcode}"
+            )
+        return store
+
+    async def async_search(self, client: KecoApiClient, zcode: str, query: str) -> list[dict[str, str]]:
+        terms = [t.strip().lower() for t in (query or "").split() if t.strip()]
+        if not terms:
+            return []
+
+        zone = await self._async_zone(client, zcode)
+        return zone.search(terms)
+
+    async def async_nearest(
+        self,
+        client: KecoApiClient,
+        zcodes: list[str],
+        lat: float,
+        lng: float,
+        max_km: float | None = None,
+    ) -> Iterator[tuple[float, dict[str, str]]]:
+        """(distance km, station) across the given zones, nearest first and lazy."""
+        zones: list[_ZoneCatalog] = []
+        for zcode in zcodes:
+            zone = await self._async_zone(client, zcode)
+            if not zone.grid:
+                # Stored before coordinates were kept: nothing to index until refreshed.
+                async with self._locks.setdefault(zcode, asyncio.Lock()):
+                    zone = self._zones[zcode]
+                    if time.time() - zone.fetched_at >= CATALOG_TTL:
+                        zone = await self._async_refresh(client, zcode)
+            zones.append(zone)
+        return heapq.merge(*(zone.nearest(lat, lng, max_km) for zone in zones), key=lambda item: item[0])
+
+    async def _async_zone(self, client: KecoApiClient, zcode: str) -> _ZoneCatalog:
+        zone = await self._async_get_zone(client, zcode)
+        if time.time() - zone.fetched_at >= CATALOG_TTL and zcode not in self._refreshing:
+            self._refreshing.add(zcode)
+            self.hass.async_create_background_task(
+                self._async_background_refresh(client, zcode),
+                f"keco_evcharger catalog refresh {zcode}",
+            )
+        return zone
+
+    async def _async_get_zone(self, client: KecoApiClient, zcode: str) -> _ZoneCatalog:
+        lock = self._locks.setdefault(zcode, asyncio.Lock())
+        async with lock:
+            zone = self._zones.get(zcode)
+            if zone is not None:
+                return zone
+            stored = await self._store(zcode).async_load()
+            if stored and stored.get("rows"):
+                rows, fetched_at = stored["rows"], float(stored.get("fetched_at", 0))
+                if len(rows[0]) < len(_FIELDS):
+                    # Saved before coordinates were kept: still searchable, refreshed on use.
+                    rows = [row + [""] * (len(_FIELDS) - len(row)) for row in rows]
+                    fetched_at = 0.0
+                zone = self._zones[zcode] = _ZoneCatalog(rows, fetched_at)
+                return zone
+            return await self._async_refresh(client, zcode)
+
+    async def _async_refresh(self, client: KecoApiClient, zcode: str) -> _ZoneCatalog:
+        stations = await client.get_zone_stations(zcode)
+        rows = [[s.get(field, "") for field in _FIELDS] for s in stations]
+        zone = self._zones[zcode] = _ZoneCatalog(rows, time.time())
+        await self._store(zcode).async_save({"fetched_at": zone.fetched_at, "rows": rows})
+        return zone
+
+    async def _async_background_refresh(self, client: KecoApiClient, zcode: str) -> None:
+        try:
+            async with self._locks.setdefault(zcode, asyncio.Lock()):
+                zone = self._zones.get(zcode)
+                # A caller may have refreshed it while this task waited for the lock.
+                if zone is None or time.time() - zone.fetched_at >= CATALOG_TTL:
+                    await self._async_refresh(client, zcode)
+        except Exception as err:  # noqa: BLE001
+            _LOGGER.debug("KECO catalogue refresh for zcode %s failed: %s", zcode, err)
+        finally:
+            self._refreshing.discard(zcode)
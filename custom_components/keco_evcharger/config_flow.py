@@ -1,54 +1,64 @@
 from __future__ import annotations
 
+import asyncio
+from itertools import islice
 from typing import Any
 
 import voluptuous as vol
 from homeassistant import config_entries
+from homeassistant.const import CONF_LATITUDE, CONF_LOCATION, CONF_LONGITUDE, CONF_RADIUS
 from homeassistant.core import callback
 from homeassistant.data_entry_flow import FlowResult
-from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers import config_validation as cv, selector
 
-from .api import KecoApiClient
+from . import async_get_catalog, async_get_client, async_release_flow_client
+from .api import PRIORITY_INTERACTIVE, KecoApiClient
 from .const import (
     CONF_API_KEY,
+    CONF_DAILY_REQUEST_BUDGET,
     CONF_ENABLED_CHARGERS,
     CONF_MAX_CONSECUTIVE_FAILURES,
+    CONF_PROFILING,
+    CONF_SLOW_CYCLE_THRESHOLD,
     CONF_STAT_ID,
     CONF_STAT_NM,
     CONF_ADDR,
     CONF_BUSI_NM,
+    CONF_STATIONS,
+    CONF_ZCODE,
+    DEFAULT_DAILY_REQUEST_BUDGET,
     DEFAULT_MAX_CONSECUTIVE_FAILURES,
+    DEFAULT_SLOW_CYCLE_THRESHOLD,
     DOMAIN,
+    NEARBY_DEFAULT_RADIUS,
+    NEARBY_RESULTS,
+    RESPONSE_CACHE_TTL,
+    ZCODE_OPTIONS,
 )
 
-ZCODE_OPTIONS = {
-    "11": "서울",
-    "26": "부산",
-    "27": "대구",
-    "28": "인천",
-    "29": "광주",
-    "30": "대전",
-    "31": "울산",
-    "36": "세종",
-    "41": "경기",
-    "42": "강원",
-    "43": "충북",
-    "44": "충남",
-    "45": "전북",
-    "46": "전남",
-    "47": "경북",
-    "48": "경남",
-    "50": "제주",
-}
-
 
 class KecoConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
-    VERSION = 2
+    VERSION = 3
 
     def __init__(self) -> None:
         self._api_key: str = ""
         self._search_results: list[dict[str, Any]] = []
         self._search_zcode: str = "11"
+        # statId -> station picked so far; one entry can hold stations from several searches.
+        self._picked: dict[str, dict[str, str]] = {}
+
+    @callback
+    def async_remove(self) -> None:
+        # Closes the key's pooled client if this flow opened it and no entry uses it.
+        if self._api_key:
+            async_release_flow_client(self.hass, self._api_key, self.flow_id)
+
+    def _configured_stat_ids(self) -> set[str]:
+        return {
+            station.get(CONF_STAT_ID, "")
+            for entry in self._async_current_entries(include_ignore=False)
+            for station in entry.data.get(CONF_STATIONS, [])
+        }
 
     async def async_step_user(self, user_input: dict[str, Any] | None = None) -> FlowResult:
         errors: dict[str, str] = {}
@@ -56,10 +66,11 @@ class KecoConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         existing = self._async_current_entries()
         if existing:
             self._api_key = existing[0].data.get(CONF_API_KEY, "")
-            return await self.async_step_search_station()
+            return await self.async_step_search_method()
 
         if user_input is not None:
             api_key = user_input[CONF_API_KEY].strip()
+            # Throwaway client: an unverified key must not be kept in the shared pool.
             client = KecoApiClient(api_key)
             try:
                 await client.validate_key()
@@ -67,11 +78,16 @@ class KecoConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 errors["base"] = "cannot_connect"
             else:
                 self._api_key = api_key
-                return await self.async_step_search_station()
+                return await self.async_step_search_method()
+            finally:
+                await client.async_close()
 
         schema = vol.Schema({vol.Required(CONF_API_KEY): str})
         return self.async_show_form(step_id="user", data_schema=schema, errors=errors)
 
+    async def async_step_search_method(self, user_input: dict[str, Any] | None = None) -> FlowResult:
+        return self.async_show_menu(step_id="search_method", menu_options=["search_station", "search_nearby"])
+
     async def async_step_search_station(self, user_input: dict[str, Any] | None = None) -> FlowResult:
         errors: dict[str, str] = {}
 
@@ -79,9 +95,9 @@ class KecoConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             query = user_input["query"].strip()
             zcode = str(user_input.get("zcode", "11"))
             self._search_zcode = zcode
-            client = KecoApiClient(self._api_key)
+            client = async_get_client(self.hass, self._api_key, self.flow_id)
             try:
-                self._search_results = await client.search_stations(query, zcode=zcode)
+                self._search_results = await async_get_catalog(self.hass).async_search(client, zcode, query)
             except Exception:  # noqa: BLE001
                 errors["base"] = "cannot_connect"
             else:
@@ -98,47 +114,111 @@ class KecoConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         )
         return self.async_show_form(step_id="search_station", data_schema=schema, errors=errors)
 
-    async def async_step_pick_station(self, user_input: dict[str, Any] | None = None) -> FlowResult:
+    async def async_step_search_nearby(self, user_input: dict[str, Any] | None = None) -> FlowResult:
+        errors: dict[str, str] = {}
+
         if user_input is not None:
-            if user_input.get("reset", False):
-                self._search_results = []
-                self._search_zcode = "11"
-                return await self.async_step_search_station()
+            zcode = str(user_input.get("zcode", "11"))
+            location = user_input[CONF_LOCATION]
+            self._search_zcode = zcode
+            client = async_get_client(self.hass, self._api_key, self.flow_id)
+            try:
+                nearest = await async_get_catalog(self.hass).async_nearest(
+                    client,
+                    [zcode],
+                    location[CONF_LATITUDE],
+                    location[CONF_LONGITUDE],
+                    location.get(CONF_RADIUS, NEARBY_DEFAULT_RADIUS) / 1000,
+                )
+            except Exception:  # noqa: BLE001
+                errors["base"] = "cannot_connect"
+            else:
+                self._search_results = [
+                    {**station, "distance_km": round(dist, 2)} for dist, station in islice(nearest, NEARBY_RESULTS)
+                ]
+                if not self._search_results:
+                    errors["base"] = "no_results"
+                else:
+                    return await self.async_step_pick_station()
 
-            idx = int(user_input["station"])
-            picked = self._search_results[idx]
-            stat_id = picked.get(CONF_STAT_ID, "")
+        schema = vol.Schema(
+            {
+                vol.Required("zcode", default=self._search_zcode): vol.In(ZCODE_OPTIONS),
+                vol.Required(
+                    CONF_LOCATION,
+                    default={
+                        CONF_LATITUDE: self.hass.config.latitude,
+                        CONF_LONGITUDE: self.hass.config.longitude,
+                        CONF_RADIUS: NEARBY_DEFAULT_RADIUS,
+                    },
+                ): selector.LocationSelector(selector.LocationSelectorConfig(radius=True)),
+            }
+        )
+        return self.async_show_form(step_id="search_nearby", data_schema=schema, errors=errors)
 
-            await self.async_set_unique_id(stat_id)
-            self._abort_if_unique_id_configured()
+    async def async_step_pick_station(self, user_input: dict[str, Any] | None = None) -> FlowResult:
+        errors: dict[str, str] = {}
+        configured = self._configured_stat_ids()
+        candidates = {
+            str(i): s
+            for i, s in enumerate(self._search_results)
+            if s.get(CONF_STAT_ID) and s[CONF_STAT_ID] not in configured
+        }
+        if not candidates and not self._picked:
+            return self.async_abort(reason="already_configured")
 
-            title = f"{picked.get(CONF_STAT_NM, stat_id)} ({stat_id})"
-            return self.async_create_entry(
-                title=title,
-                data={
-                    CONF_API_KEY: self._api_key,
-                    CONF_STAT_ID: stat_id,
+        if user_input is not None:
+            for idx in user_input.get(CONF_STATIONS, []):
+                picked = candidates[idx]
+                self._picked[picked[CONF_STAT_ID]] = {
+                    CONF_STAT_ID: picked[CONF_STAT_ID],
                     CONF_STAT_NM: picked.get(CONF_STAT_NM, ""),
                     CONF_ADDR: picked.get(CONF_ADDR, ""),
                     CONF_BUSI_NM: picked.get(CONF_BUSI_NM, ""),
-                },
-                options={
-                    CONF_ENABLED_CHARGERS: [],
-                    CONF_MAX_CONSECUTIVE_FAILURES: DEFAULT_MAX_CONSECUTIVE_FAILURES,
-                },
-            )
+                    CONF_ZCODE: self._search_zcode,
+                }
+
+            if user_input.get("search_more", False):
+                self._search_results = []
+                return await self.async_step_search_method()
+            if self._picked:
+                return self._async_create_stations_entry()
+            errors["base"] = "no_station_selected"
 
         options = {
-            str(i): f"{s.get(CONF_STAT_NM,'')} | {s.get(CONF_ADDR,'')} | {s.get(CONF_BUSI_NM,'')} | {s.get(CONF_STAT_ID,'')}"
-            for i, s in enumerate(self._search_results)
+            idx: f"{s.get(CONF_STAT_NM,'')} | {s.get(CONF_ADDR,'')} | {s.get(CONF_BUSI_NM,'')} | {s.get(CONF_STAT_ID,'')}"
+            + (f" | {s['distance_km']} km" if "distance_km" in s else "")
+            for idx, s in candidates.items()
         }
         schema = vol.Schema(
             {
-                vol.Required("station"): vol.In(options),
-                vol.Optional("reset", default=False): bool,
+                vol.Optional(CONF_STATIONS, default=[]): cv.multi_select(options),
+                vol.Optional("search_more", default=False): bool,
             }
         )
-        return self.async_show_form(step_id="pick_station", data_schema=schema)
+        return self.async_show_form(
+            step_id="pick_station",
+            data_schema=schema,
+            errors=errors,
+            description_placeholders={"picked": str(len(self._picked))},
+        )
+
+    @callback
+    def _async_create_stations_entry(self) -> FlowResult:
+        stations = list(self._picked.values())
+        first = stations[0]
+        title = f"{first[CONF_STAT_NM] or first[CONF_STAT_ID]} ({first[CONF_STAT_ID]})"
+        if len(stations) > 1:
+            title = f"{first[CONF_STAT_NM] or first[CONF_STAT_ID]} 외 {len(stations) - 1}곳"
+        return self.async_create_entry(
+            title=title,
+            data={CONF_API_KEY: self._api_key, CONF_STATIONS: stations},
+            options={
+                CONF_ENABLED_CHARGERS: {},
+                CONF_MAX_CONSECUTIVE_FAILURES: DEFAULT_MAX_CONSECUTIVE_FAILURES,
+                CONF_DAILY_REQUEST_BUDGET: DEFAULT_DAILY_REQUEST_BUDGET,
+            },
+        )
 
     @staticmethod
     @callback
@@ -149,42 +229,83 @@ class KecoConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 class KecoOptionsFlow(config_entries.OptionsFlow):
     def __init__(self, entry: config_entries.ConfigEntry) -> None:
         self.entry = entry
-        self.client = KecoApiClient(entry.data[CONF_API_KEY])
+
+    @callback
+    def async_remove(self) -> None:
+        async_release_flow_client(self.hass, self.entry.data[CONF_API_KEY], self.flow_id)
+
+    async def _async_charger_ids(self, station: dict[str, str]) -> list[str]:
+        data = self.hass.data.get(DOMAIN, {}).get(self.entry.entry_id)
+        for view in data["stations"] if data else ():
+            if view.stat_id == station[CONF_STAT_ID]:
+                return sorted(view.rows_by_chger_id)
+        client = async_get_client(self.hass, self.entry.data[CONF_API_KEY], self.flow_id)
+        chargers = await client.get_station_chargers(
+            station[CONF_STAT_ID], cache=True, max_age=RESPONSE_CACHE_TTL, stale_ok=True, priority=PRIORITY_INTERACTIVE
+        )
+        return sorted({str(c.get("chgerId", "")).strip() for c in chargers if str(c.get("chgerId", "")).strip()})
 
     async def async_step_init(self, user_input: dict[str, Any] | None = None) -> FlowResult:
         errors: dict[str, str] = {}
-        stat_id = self.entry.data.get(CONF_STAT_ID, "")
+        stations = self.entry.data.get(CONF_STATIONS, [])
 
+        # Loaded entries answer from the coordinator; otherwise usually from its last poll.
         try:
-            chargers = await self.client.get_station_chargers(stat_id)
+            charger_ids = await asyncio.gather(*(self._async_charger_ids(station) for station in stations))
         except Exception:  # noqa: BLE001
             return self.async_show_form(step_id="init", data_schema=vol.Schema({}), errors={"base": "cannot_connect"})
 
-        ids = sorted({str(c.get("chgerId", "")).strip() for c in chargers if str(c.get("chgerId", "")).strip()})
-        options = {cid: f"충전기 {cid}" for cid in ids}
+        # Keys are "statId/chgerId" so one list covers every station of the entry.
+        options: dict[str, str] = {}
+        for station, ids in zip(stations, charger_ids):
+            prefix = f"{station.get(CONF_STAT_NM) or station[CONF_STAT_ID]} " if len(stations) > 1 else ""
+            for cid in ids:
+                options[f"{station[CONF_STAT_ID]}/{cid}"] = f"{prefix}충전기 {cid}"
 
         if user_input is not None:
-            selected = user_input.get(CONF_ENABLED_CHARGERS, [])
+            selected: dict[str, list[str]] = {}
+            for key in user_input.get(CONF_ENABLED_CHARGERS, []):
+                stat_id, _, chger_id = key.partition("/")
+                selected.setdefault(stat_id, []).append(chger_id)
             max_failures = int(user_input.get(CONF_MAX_CONSECUTIVE_FAILURES, DEFAULT_MAX_CONSECUTIVE_FAILURES))
+            daily_budget = int(user_input.get(CONF_DAILY_REQUEST_BUDGET, DEFAULT_DAILY_REQUEST_BUDGET))
+            slow_cycle = float(user_input.get(CONF_SLOW_CYCLE_THRESHOLD, DEFAULT_SLOW_CYCLE_THRESHOLD))
             return self.async_create_entry(
                 title="",
                 data={
                     **self.entry.options,
                     CONF_ENABLED_CHARGERS: selected,
                     CONF_MAX_CONSECUTIVE_FAILURES: max(1, min(max_failures, 20)),
+                    CONF_DAILY_REQUEST_BUDGET: max(100, min(daily_budget, 1000000)),
+                    CONF_PROFILING: bool(user_input.get(CONF_PROFILING, False)),
+                    CONF_SLOW_CYCLE_THRESHOLD: max(0.0, min(slow_cycle, 600.0)),
                 },
             )
 
+        enabled = self.entry.options.get(CONF_ENABLED_CHARGERS) or {}
+        default: list[str] = []
+        for key in options:
+            stat_id, _, chger_id = key.partition("/")
+            if not enabled.get(stat_id) or chger_id in enabled[stat_id]:
+                default.append(key)
         schema = vol.Schema(
             {
-                vol.Optional(
-                    CONF_ENABLED_CHARGERS,
-                    default=self.entry.options.get(CONF_ENABLED_CHARGERS, ids),
-                ): cv.multi_select(options),
+                vol.Optional(CONF_ENABLED_CHARGERS, default=default): cv.multi_select(options),
                 vol.Optional(
                     CONF_MAX_CONSECUTIVE_FAILURES,
                     default=int(self.entry.options.get(CONF_MAX_CONSECUTIVE_FAILURES, DEFAULT_MAX_CONSECUTIVE_FAILURES)),
                 ): vol.All(vol.Coerce(int), vol.Range(min=1, max=20)),
+                vol.Optional(
+                    CONF_DAILY_REQUEST_BUDGET,
+                    default=int(self.entry.options.get(CONF_DAILY_REQUEST_BUDGET, DEFAULT_DAILY_REQUEST_BUDGET)),
+                ): vol.All(vol.Coerce(int), vol.Range(min=100, max=1000000)),
+                vol.Optional(
+                    CONF_PROFILING, default=bool(self.entry.options.get(CONF_PROFILING, False))
+                ): cv.boolean,
+                vol.Optional(
+                    CONF_SLOW_CYCLE_THRESHOLD,
+                    default=float(self.entry.options.get(CONF_SLOW_CYCLE_THRESHOLD, DEFAULT_SLOW_CYCLE_THRESHOLD)),
+                ): vol.All(vol.Coerce(float), vol.Range(min=0, max=600)),
             }
         )
         return self.async_show_form(step_id="init", data_schema=schema, errors=errors)
@@ -8,11 +8,136 @@ CONF_STAT_ID = "statId"
 CONF_STAT_NM = "statNm"
 CONF_ADDR = "addr"
 CONF_BUSI_NM = "busiNm"
+CONF_ZCODE = "zcode"
+CONF_STATIONS = "stations"
 CONF_ENABLED_CHARGERS = "enabled_chargers"
 CONF_MAX_CONSECUTIVE_FAILURES = "max_consecutive_failures"
+CONF_DAILY_REQUEST_BUDGET = "daily_request_budget"
+CONF_PROFILING = "profiling"
+CONF_SLOW_CYCLE_THRESHOLD = "slow_cycle_threshold"
 
-DEFAULT_UPDATE_INTERVAL = 300  # 5 min fixed
+# hass.data[DOMAIN] keys shared by all config entries (entry_id keys hold per-entry data)
+DATA_CLIENTS = "clients"
+DATA_CATALOG = "catalog"
+
+DEFAULT_UPDATE_INTERVAL = 300  # 5 min baseline
 DEFAULT_MAX_CONSECUTIVE_FAILURES = 3
+DEFAULT_DAILY_REQUEST_BUDGET = 10000
+
+# Adaptive polling: poll faster while a charger is charging or statuses are
+# changing, back off after IDLE_POLLS_BEFORE_BACKOFF unchanged polls. The daily
+# request budget (shared per API key) can only lengthen the interval.
+ACTIVE_UPDATE_INTERVAL = 120
+MAX_UPDATE_INTERVAL = 1200
+IDLE_POLLS_BEFORE_BACKOFF = 3
+
+# A config entry holds one or more stations; all stations of an API key are
+# fetched by one coordinator per cycle, at most this many at a time. The
+# nearest_free_chargers service checks stations in batches of the same size.
+STATION_FETCH_CONCURRENCY = 4
+
+# A zone is polled once per cycle through getChargerStatus, instead of one
+# getChargerInfo request per station, when it has at least this many configured
+# stations and at least as many as its full status feed has pages (of
+# ZONE_PAGE_SIZE rows). The full feed is downloaded at setup and every
+# FULL_RESYNC_INTERVAL; with fewer stations than pages, per-station requests
+# are cheaper.
+ZONE_POLL_MIN_STATIONS = 2
+ZONE_PAGE_SIZE = 9999
+# Parallel getChargerInfo page requests when loading a zone's station list
+# (stays below the pooled client's max_connections).
+ZONE_PAGE_CONCURRENCY = 4
+
+# Zone polling is incremental: getChargerStatus `period` (minutes, upstream max 10)
+# returns only rows whose status changed recently. Full zone status and station
+# getChargerInfo rows are re-fetched at least this often for consistency.
+STATUS_DELTA_MAX_PERIOD = 10
+FULL_RESYNC_INTERVAL = 3600
+# Idle backoff cap for a key with zone-polled stations. A delta fetch asks for the
+# gap in whole minutes plus one, so longer gaps fall back to full zone downloads;
+# another minute is left for the duration of the cycle itself.
+ZONE_POLL_MAX_INTERVAL = (STATUS_DELTA_MAX_PERIOD - 2) * 60
+
+# Transient upstream failures (timeouts, connection errors, 5xx/429) are retried
+# with exponential backoff and jitter (seconds). A per-API-key circuit breaker then
+# suspends all calls after BREAKER_FAILURE_THRESHOLD failed requests in a row.
+RETRY_ATTEMPTS = 3
+RETRY_BACKOFF_BASE = 1.0
+RETRY_BACKOFF_MAX = 8.0
+BREAKER_FAILURE_THRESHOLD = 5
+BREAKER_RECOVERY_TIME = 120
+
+# Per-API-key request scheduling, shared by coordinators, flows and services: a
+# token bucket allows RATE_LIMIT_PER_SECOND requests per second (bursts up to
+# RATE_LIMIT_BURST), at most MAX_CONCURRENT_REQUESTS are in flight, and waiting
+# requests are served by priority (polls, then dialogs/services, then bulk loads).
+RATE_LIMIT_PER_SECOND = 20.0
+RATE_LIMIT_BURST = 20
+MAX_CONCURRENT_REQUESTS = 6
+
+# Station getChargerInfo responses asked for by UI dialogs and services (not by
+# polls) are cached per client, LRU-bounded. They accept entries up to
+# RESPONSE_CACHE_TTL seconds old, or older ones while a background refresh runs.
+RESPONSE_CACHE_SIZE = 128
+RESPONSE_CACHE_TTL = 300
+
+# Station search catalogue: per-zcode station list persisted in .storage and
+# refreshed in the background once older than CATALOG_TTL (seconds).
+CATALOG_STORAGE_KEY = f"{DOMAIN}.catalog"
+CATALOG_STORAGE_VERSION = 1
+CATALOG_TTL = 86400
+# Station coordinates are indexed on a lat/lng grid of this cell size (degrees,
+# about 1.1 km north-south) for nearest-station queries.
+CATALOG_GRID_DEG = 0.01
+# "Near a location" search: default radius (metres, as the location selector
+# reports it) and how many stations are offered.
+NEARBY_DEFAULT_RADIUS = 3000
+NEARBY_RESULTS = 20
+# nearest_free_chargers checks live status of at most this many stations.
+NEARBY_MAX_STATIONS = 20
+
+# Per-charger status history: ring buffers of `stat` transitions and finished
+# sessions, persisted per station. A change is written HISTORY_SAVE_DELAY seconds
+# after the first unsaved one (so at most once per delay), and at once on unload.
+# Statistic sensors cover the last HISTORY_SENSOR_DAYS days.
+HISTORY_STORAGE_KEY = f"{DOMAIN}.history"
+HISTORY_STORAGE_VERSION = 1
+HISTORY_TRANSITIONS = 1024
+HISTORY_SESSIONS = 256
+HISTORY_SAVE_DELAY = 600
+HISTORY_SENSOR_DAYS = 7
+
+# Last known charger rows per config entry, saved STATE_SAVE_DELAY seconds after
+# the first update that changed them since the last write, and at once on unload.
+# At setup, stations restored from a
+# snapshot younger than STATE_RESTORE_MAX_AGE come up at once and are refreshed in
+# the background instead of being fetched before the entities are created.
+STATE_STORAGE_KEY = f"{DOMAIN}.state"
+STATE_STORAGE_VERSION = 1
+STATE_SAVE_DELAY = 60
+STATE_RESTORE_MAX_AGE = 86400
+
+# Bulk zone export (export_zones service): gzip files under <config>/EXPORT_DIR,
+# getChargerInfo pages of EXPORT_PAGE_SIZE rows, at most EXPORT_ZONE_CONCURRENCY
+# zones at a time. Progress is checkpointed per page so interrupted runs resume.
+EXPORT_DIR = f"{DOMAIN}_export"
+EXPORT_PAGE_SIZE = 1000
+EXPORT_ZONE_CONCURRENCY = 2
+EXPORT_FORMATS = ("ndjson", "csv")
+
+# Profiling (see profiling.KecoProfiler): update cycles slower than the threshold
+# (seconds, 0 = never) are logged with their phase breakdown. cProfile dumps of the
+# profile_cycles service go to <config>/PROFILE_DIR.
+DEFAULT_SLOW_CYCLE_THRESHOLD = 10
+PROFILE_DIR = f"{DOMAIN}_profile"
+PROFILE_TOP_FUNCTIONS = 20
+
+# Fired once per charger `stat` transition seen by a coordinator update (after the
+# entity states are written); device triggers are built on it.
+EVENT_STATUS_CHANGED = f"{DOMAIN}_status_changed"
+
+# Fields carried by getChargerStatus rows; everything else comes from getChargerInfo.
+STATUS_FIELDS = ("stat", "statUpdDt", "lastTsdt", "lastTedt", "nowTsdt")
 
 API_BASE = "https://apis.data.go.kr/B552584/EvCharger"
 
@@ -24,3 +149,23 @@ STAT_TEXT = {
     "5": "점검중",
     "9": "상태미확인",
 }
+
+ZCODE_OPTIONS = {
+    "11": "서울",
+    "26": "부산",
+    "27": "대구",
+    "28": "인천",
+    "29": "광주",
+    "30": "대전",
+    "31": "울산",
+    "36": "세종",
+    "41": "경기",
+    "42": "강원",
+    "43": "충북",
+    "44": "충남",
+    "45": "전북",
+    "46": "전남",
+    "47": "경북",
+    "48": "경남",
+    "50": "제주",
+}
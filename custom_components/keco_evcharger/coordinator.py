@@ -1,35 +1,180 @@
 from __future__ import annotations
 
-from datetime import timedelta
-from typing import Any
-
+import asyncio
+from datetime import datetime, timedelta
+from functools import partial
+import hashlib
 import logging
+import time
+from time import perf_counter
+from typing import Any
 
-from homeassistant.core import HomeAssistant
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import ConfigEntryNotReady
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util import dt as dt_util
 
 from .api import KecoApiClient
+from .budget import KecoRequestBudget
 from .const import (
-    CONF_ADDR,
-    CONF_BUSI_NM,
+    ACTIVE_UPDATE_INTERVAL,
+    CONF_DAILY_REQUEST_BUDGET,
     CONF_MAX_CONSECUTIVE_FAILURES,
+    CONF_PROFILING,
+    CONF_SLOW_CYCLE_THRESHOLD,
     CONF_STAT_ID,
     CONF_STAT_NM,
+    CONF_STATIONS,
+    CONF_ZCODE,
+    DEFAULT_DAILY_REQUEST_BUDGET,
     DEFAULT_MAX_CONSECUTIVE_FAILURES,
+    DEFAULT_SLOW_CYCLE_THRESHOLD,
     DEFAULT_UPDATE_INTERVAL,
+    DOMAIN,
+    EVENT_STATUS_CHANGED,
+    FULL_RESYNC_INTERVAL,
+    IDLE_POLLS_BEFORE_BACKOFF,
+    MAX_UPDATE_INTERVAL,
+    STATE_RESTORE_MAX_AGE,
+    STATE_SAVE_DELAY,
+    STATE_STORAGE_KEY,
+    STATE_STORAGE_VERSION,
+    STATION_FETCH_CONCURRENCY,
+    STAT_TEXT,
+    ZONE_POLL_MAX_INTERVAL,
 )
+from .history import StationHistory
+from .models import ChargerState, StationSummary, parse_ts
+from .profiling import KecoProfiler
+from .zone import KecoZonePoller
 
 _LOGGER = logging.getLogger(__name__)
 
 
-class KecoCoordinator(DataUpdateCoordinator[dict[str, list[dict[str, Any]]]]):
+def _status_event(view: KecoStationView, old: ChargerState, new: ChargerState) -> dict[str, Any]:
+    # Payload of EVENT_STATUS_CHANGED; device triggers match on stat_id/chger_id/stat.
+    return {
+        "entry_id": view.entry_id,
+        "stat_id": new.stat_id,
+        "stat_nm": view.name,
+        "chger_id": new.chger_id,
+        "old_stat": old.stat,
+        "new_stat": new.stat,
+        "old_state": STAT_TEXT.get(old.stat, old.stat),
+        "new_state": STAT_TEXT.get(new.stat, new.stat),
+        "stat_upd_dt": new.stat_upd_dt.isoformat() if new.stat_upd_dt else None,
+    }
+
+
+def _restore_rows(snapshot: dict[str, Any] | None) -> dict[str, list[ChargerState]]:
+    # statId -> last known rows of a state Store snapshot, if recent enough to show.
+    if not snapshot or time.time() - snapshot.get("saved_at", 0) > STATE_RESTORE_MAX_AGE:
+        return {}
+    restored: dict[str, list[ChargerState]] = {}
+    for stat_id, rows in snapshot.get("stations", {}).items():
+        try:
+            states = [ChargerState.from_dict(row) for row in rows]
+        except (TypeError, ValueError):
+            continue
+        if states:
+            restored[stat_id] = states
+    return restored
+
+
+# One configured station as served by KecoCoordinator: its last known rows plus the
+# per-update index, change set and aggregates the sensor platform reads.
+class KecoStationView:
+    def __init__(self, entry_id: str, station: dict[str, str], max_consecutive_failures: int) -> None:
+        self.entry_id = entry_id
+        self.station = station
+        # API error tolerance:
+        # - failures 1~2: keep previous state (do not mark entities unavailable)
+        # - failure 3+: mark this station's entities unavailable
+        self.max_consecutive_failures = max(1, int(max_consecutive_failures))
+        self.consecutive_failures = 0
+        # Keep last known charger rows to avoid transient `unavailable`
+        # when upstream API temporarily omits one charger in a station response.
+        self.last_rows_by_chger_id: dict[str, ChargerState] = {}
+        # chgerId -> row of the current data, rebuilt once per update so entities
+        # do not scan the station's row list on every state read.
+        self.rows_by_chger_id: dict[str, ChargerState] = {}
+        # chgerIds whose row differs from the previous update; entities of other
+        # chargers skip their state write.
+        self.changed_chger_ids: set[str] = set()
+        # (old, new) rows of chargers whose `stat` changed in the last update.
+        self.stat_transitions: list[tuple[ChargerState, ChargerState]] = []
+        # Station aggregates, updated from changed_chger_ids only.
+        self.summary = StationSummary()
+        # Persisted `stat` transitions per charger; attached by the coordinator.
+        self.history: StationHistory | None = None
+        # Static getChargerInfo rows are re-fetched periodically even when status
+        # comes from the zone delta feed.
+        self.static_synced_at: float | None = None
+
+    @property
+    def stat_id(self) -> str:
+        return self.station.get(CONF_STAT_ID, "")
+
+    @property
+    def name(self) -> str:
+        return self.station.get(CONF_STAT_NM) or self.stat_id
+
+    @property
+    def available(self) -> bool:
+        return self.consecutive_failures < self.max_consecutive_failures
+
+    @property
+    def status_changed(self) -> bool:
+        return bool(self.stat_transitions)
+
+    def merge(self, rows: list[ChargerState], now: datetime) -> list[ChargerState]:
+        # Refresh last-known cache from latest payload.
+        seen: set[str] = set()
+        for row in rows:
+            seen.add(row.chger_id)
+            self.last_rows_by_chger_id[row.chger_id] = row
+
+        # If a charger is temporarily missing in this poll, keep last known row.
+        merged: list[ChargerState] = list(rows)
+        for chger_id, cached in self.last_rows_by_chger_id.items():
+            if chger_id in seen:
+                continue
+            merged.append(cached)
+
+        index: dict[str, ChargerState] = {}
+        for row in merged:
+            index.setdefault(row.chger_id, row)
+        previous = self.rows_by_chger_id
+        self.changed_chger_ids = {cid for cid, row in index.items() if previous.get(cid) != row}
+        self.stat_transitions = [
+            (previous[cid], index[cid])
+            for cid in self.changed_chger_ids
+            if cid in previous and previous[cid].stat != index[cid].stat
+        ]
+        self.rows_by_chger_id = index
+        epoch = int(now.timestamp())
+        for cid in self.changed_chger_ids:
+            self.summary.apply(previous.get(cid), index[cid])
+            if self.history is not None:
+                self.history.record(previous.get(cid), index[cid], epoch)
+        self.summary.commit(now)
+        return merged
+
+
+# One per API key: every station of every config entry using the key is fetched in
+# the same scheduled cycle, so the key has a single timer no matter how many
+# stations are configured. Data is {statId: rows}; entities read their station's
+# KecoStationView.
+class KecoCoordinator(DataUpdateCoordinator[dict[str, list[ChargerState]]]):
     def __init__(
         self,
         hass: HomeAssistant,
         client: KecoApiClient,
-        station: dict[str, str],
         update_interval: int = DEFAULT_UPDATE_INTERVAL,
-        max_consecutive_failures: int = DEFAULT_MAX_CONSECUTIVE_FAILURES,
+        zone_poller: KecoZonePoller | None = None,
+        budget: KecoRequestBudget | None = None,
     ) -> None:
         super().__init__(
             hass,
@@ -38,77 +183,287 @@ class KecoCoordinator(DataUpdateCoordinator[dict[str, list[dict[str, Any]]]]):
             update_interval=timedelta(seconds=update_interval),
         )
         self.client = client
-        self.station = station
-        self._max_consecutive_failures = max(1, int(max_consecutive_failures))
-        # Keep last known charger rows to avoid transient `unavailable`
-        # when upstream API temporarily omits one charger in a station response.
-        self._last_rows_by_chger_id: dict[str, dict[str, Any]] = {}
-        # API error tolerance:
-        # - failures 1~2: keep previous state (do not mark entities unavailable)
-        # - failure 3+: mark unavailable by raising UpdateFailed
-        self._consecutive_failures = 0
-
-    @classmethod
-    def from_entry(cls, hass: HomeAssistant, entry, client: KecoApiClient):
-        # backward compatibility for early single-entry/stations[] prototype
-        stat_id = entry.data.get(CONF_STAT_ID)
-        if not stat_id:
-            stations = (entry.options or {}).get("stations", [])
-            first = stations[0] if stations else {}
-            station = {
-                CONF_STAT_ID: first.get(CONF_STAT_ID, ""),
-                CONF_STAT_NM: first.get(CONF_STAT_NM, ""),
-                CONF_ADDR: first.get(CONF_ADDR, ""),
-                CONF_BUSI_NM: first.get(CONF_BUSI_NM, ""),
-            }
-        else:
-            station = {
-                CONF_STAT_ID: entry.data.get(CONF_STAT_ID, ""),
-                CONF_STAT_NM: entry.data.get(CONF_STAT_NM, ""),
-                CONF_ADDR: entry.data.get(CONF_ADDR, ""),
-                CONF_BUSI_NM: entry.data.get(CONF_BUSI_NM, ""),
-            }
-
-        max_failures = int((entry.options or {}).get(CONF_MAX_CONSECUTIVE_FAILURES, DEFAULT_MAX_CONSECUTIVE_FAILURES))
-        return cls(hass, client, station, DEFAULT_UPDATE_INTERVAL, max_failures)
-
-    async def _async_update_data(self) -> dict[str, list[dict[str, Any]]]:
-        stat_id = self.station.get(CONF_STAT_ID, "")
-        if not stat_id:
-            return {}
+        self.zone_poller = zone_poller
+        self.budget = budget
+        self.stations: dict[str, KecoStationView] = {}
+        self._base_interval = update_interval
+        self._idle_polls = 0
+        # Upstream requests made by the last cycle, for the daily budget.
+        self._requests_per_cycle = 0
+        # Counters are kept for monitoring.
+        self.state_writes = 0
+        self.state_writes_skipped = 0
+        # Status change events of the last cycle, fired after the entity state writes.
+        self._pending_events: list[dict[str, Any]] = []
+        # entry_id -> Store of the entry's last known rows (see STATE_STORAGE_KEY).
+        self._state_stores: dict[str, Store] = {}
+        # Entries with a delayed state save pending; see _async_save_state().
+        self._state_unsaved: set[str] = set()
+        # Background refreshes started after stations were restored from a snapshot,
+        # one per entry that restored any (several entries can set up concurrently).
+        self.restore_refreshes: set[asyncio.Task] = set()
+        # Timing spans; the client records HTTP and decode spans into the same profiler.
+        self.profiler = KecoProfiler()
+        client.profiler = self.profiler
+        # Every coordinator has the same name; slow-cycle logs tell keys apart by this.
+        self._log_name = f"{self.name} (key ...{client.api_key[-4:]})"
+        # Stable id of the API key for key-wide entity unique_ids, without the key itself.
+        self.key_id = hashlib.sha256(client.api_key.encode()).hexdigest()[:12]
+        # perf_counter() at the start of the running cycle and its phase timings,
+        # closed in async_update_listeners().
+        self._cycle_started: float | None = None
+        self._cycle_phases: dict[str, float] = {}
 
-        try:
-            rows = await self.client.get_station_chargers(stat_id)
-            self._consecutive_failures = 0
-
-            # Refresh last-known cache from latest payload.
-            seen: set[str] = set()
-            for row in rows:
-                chger_id = str(row.get("chgerId", "")).strip()
-                if not chger_id:
-                    continue
-                seen.add(chger_id)
-                self._last_rows_by_chger_id[chger_id] = row
+    async def async_add_entry(self, entry: ConfigEntry) -> list[KecoStationView]:
+        options = entry.options or {}
+        max_failures = int(options.get(CONF_MAX_CONSECUTIVE_FAILURES, DEFAULT_MAX_CONSECUTIVE_FAILURES))
+        daily_budget = int(options.get(CONF_DAILY_REQUEST_BUDGET, DEFAULT_DAILY_REQUEST_BUDGET))
+        profiling = bool(options.get(CONF_PROFILING, False))
+        slow_cycle_threshold = float(options.get(CONF_SLOW_CYCLE_THRESHOLD, DEFAULT_SLOW_CYCLE_THRESHOLD))
+
+        views: list[KecoStationView] = []
+        for station in entry.data.get(CONF_STATIONS, []):
+            view = KecoStationView(entry.entry_id, dict(station), max_failures)
+            if not view.stat_id:
+                continue
+            if view.stat_id in self.stations or any(v.stat_id == view.stat_id for v in views):
+                _LOGGER.warning("Station %s is configured more than once; ignoring duplicate", view.stat_id)
+                continue
+            views.append(view)
+
+        store: Store = Store(self.hass, STATE_STORAGE_VERSION, f"{STATE_STORAGE_KEY}_{entry.entry_id}")
+        for view in views:
+            view.history = StationHistory(self.hass, view.stat_id)
+        snapshot, *_ = await asyncio.gather(store.async_load(), *(view.history.async_load() for view in views))
+        restored = _restore_rows(snapshot)
+
+        # Only the new stations without a usable snapshot are fetched here; restored
+        # ones come up with their last known rows. The others stay on the shared timer.
+        cold = [view for view in views if view.stat_id not in restored]
+        outcomes = await self._async_fetch_all(cold)
+        for outcome in outcomes:
+            if isinstance(outcome, Exception):
+                for view in views:
+                    self._detach(view)
+                raise ConfigEntryNotReady(str(outcome)) from outcome
+
+        now = dt_util.now()
+        data = dict(self.data or {})
+        fetched = dict(zip((view.stat_id for view in cold), outcomes))
+        for view in views:
+            self.stations[view.stat_id] = view
+            rows = fetched[view.stat_id] if view.stat_id in fetched else restored[view.stat_id]
+            data[view.stat_id] = view.merge(rows, now)
+        self.data = data
+        self._state_stores[entry.entry_id] = store
+        if cold:
+            self._async_save_state(entry.entry_id)
+        if self.budget is not None:
+            self.budget.register(entry.entry_id, daily_budget)
+        self.profiler.register(entry.entry_id, profiling, slow_cycle_threshold)
+        if len(cold) < len(views):
+            _LOGGER.debug(
+                "Restored %s stations of %s; refreshing in the background", len(views) - len(cold), entry.entry_id
+            )
+            task = self.hass.async_create_background_task(
+                self.async_request_refresh(), f"{DOMAIN} refresh after restore"
+            )
+            self.restore_refreshes.add(task)
+            task.add_done_callback(self.restore_refreshes.discard)
+        return views
+
+    async def async_remove_entry(self, entry_id: str) -> None:
+        views = [view for view in self.stations.values() if view.entry_id == entry_id]
+        store = self._state_stores.pop(entry_id, None)
+        # Written now (replacing pending delayed saves) so a reload restores the
+        # latest rows and loads the histories only after they were written.
+        await asyncio.gather(
+            *([store.async_save(self._state_data(entry_id))] if store is not None else []),
+            *(view.history.async_save() for view in views if view.history is not None and view.history.unsaved),
+        )
+        self._state_unsaved.discard(entry_id)
+        for view in views:
+            del self.stations[view.stat_id]
+            self._detach(view)
+        if self.data:
+            self.data = {stat_id: rows for stat_id, rows in self.data.items() if stat_id in self.stations}
+        if self.budget is not None:
+            self.budget.unregister(entry_id)
+        self.profiler.unregister(entry_id)
+
+    @callback
+    def _async_save_state(self, entry_id: str) -> None:
+        # Armed once per write (see StationHistory): re-arming on every changed
+        # cycle would keep pushing the write back.
+        store = self._state_stores.get(entry_id)
+        if store is not None and entry_id not in self._state_unsaved:
+            self._state_unsaved.add(entry_id)
+            store.async_delay_save(partial(self._state_data, entry_id), STATE_SAVE_DELAY)
+
+    def _state_data(self, entry_id: str) -> dict[str, Any]:
+        self._state_unsaved.discard(entry_id)
+        return {
+            "saved_at": int(time.time()),
+            "stations": {
+                view.stat_id: [row.as_dict() for row in view.last_rows_by_chger_id.values()]
+                for view in self.stations.values()
+                if view.entry_id == entry_id
+            },
+        }
+
+    def _detach(self, view: KecoStationView) -> None:
+        zcode = view.station.get(CONF_ZCODE, "")
+        if self.zone_poller is not None and zcode:
+            self.zone_poller.unregister(zcode, view.stat_id)
+
+    async def _async_fetch_all(self, views: list[KecoStationView]) -> list[Any]:
+        semaphore = asyncio.Semaphore(STATION_FETCH_CONCURRENCY)
+
+        async def fetch(view: KecoStationView) -> list[ChargerState]:
+            async with semaphore:
+                return await self._async_fetch_rows(view)
+
+        outcomes = await asyncio.gather(*(fetch(view) for view in views), return_exceptions=True)
+        for outcome in outcomes:
+            if isinstance(outcome, asyncio.CancelledError):
+                raise outcome
+        return outcomes
 
-            # If a charger is temporarily missing in this poll, keep last known row.
-            merged: list[dict[str, Any]] = list(rows)
-            for chger_id, cached in self._last_rows_by_chger_id.items():
-                if chger_id in seen:
+    async def _async_fetch_rows(self, view: KecoStationView) -> list[ChargerState]:
+        stat_id = view.stat_id
+        zcode = view.station.get(CONF_ZCODE, "")
+        poller = self.zone_poller
+        static_stale = (
+            view.static_synced_at is None
+            or time.monotonic() - view.static_synced_at >= FULL_RESYNC_INTERVAL
+        )
+        if poller is None or not zcode or static_stale or not await poller.async_is_polled(zcode):
+            rows = await self._async_fetch_station(view)
+            if poller is not None and not zcode:
+                # Entries created before zcode was stored: learn it from getChargerInfo.
+                zcode = next((r.zcode for r in rows if r.zcode), "")
+                if zcode:
+                    view.station[CONF_ZCODE] = zcode
+            if poller is not None and zcode:
+                poller.register(zcode, stat_id)
+            return rows
+
+        max_age = self.update_interval.total_seconds() - 30 if self.update_interval else None
+        status_rows = await poller.async_get_station_status(zcode, stat_id, max_age)
+        rows: list[ChargerState] = []
+        for status in status_rows:
+            chger_id = str(status.get("chgerId", "")).strip()
+            base = view.last_rows_by_chger_id.get(chger_id)
+            if base is None:
+                # New charger at this station: static fields only come from getChargerInfo.
+                return await self._async_fetch_station(view)
+            if base.stat_upd_dt is not None:
+                status_dt = parse_ts(status.get("statUpdDt"))
+                if status_dt is None or status_dt < base.stat_upd_dt:
+                    # Zone index can be older than our last getChargerInfo resync.
                     continue
-                merged.append(cached)
+            rows.append(base.with_status(status))
+        return rows
 
-            return {stat_id: merged}
+    async def _async_fetch_station(self, view: KecoStationView) -> list[ChargerState]:
+        raw_rows = await self.client.get_station_chargers(view.stat_id)
+        view.static_synced_at = time.monotonic()
+        rows = [ChargerState.from_row(row) for row in raw_rows]
+        return [row for row in rows if row.chger_id]
+
+    async def _async_update_data(self) -> dict[str, list[ChargerState]]:
+        views = list(self.stations.values())
+        if not views:
+            return {}
 
-        except Exception as err:  # noqa: BLE001
-            self._consecutive_failures += 1
+        self._cycle_started = started = perf_counter()
+        requests_before = self.client.stats.requests
+        outcomes = await self._async_fetch_all(views)
+        self._requests_per_cycle = self.client.stats.requests - requests_before
+        fetched = perf_counter()
+        self._cycle_phases = {"fetch": fetched - started}
 
-            if self._consecutive_failures < self._max_consecutive_failures:
+        now = dt_util.now()
+        # Stations added or removed while this cycle ran are already reflected in self.data.
+        data = {stat_id: rows for stat_id, rows in (self.data or {}).items() if stat_id in self.stations}
+        last_error: Exception | None = None
+        changed_entries: set[str] = set()
+        for view, outcome in zip(views, outcomes):
+            if self.stations.get(view.stat_id) is not view:
+                continue
+            if not isinstance(outcome, Exception):
+                view.consecutive_failures = 0
+                data[view.stat_id] = view.merge(outcome, now)
+                self._pending_events.extend(_status_event(view, old, new) for old, new in view.stat_transitions)
+                if view.changed_chger_ids:
+                    changed_entries.add(view.entry_id)
+                continue
+
+            last_error = outcome
+            view.consecutive_failures += 1
+            view.changed_chger_ids = set()
+            view.stat_transitions = []
+            if view.available:
                 _LOGGER.warning(
-                    "KECO API error (%s/%s). Keeping previous state: %s",
-                    self._consecutive_failures,
-                    self._max_consecutive_failures,
-                    err,
+                    "KECO API error for %s (%s/%s). Keeping previous state: %s",
+                    view.stat_id,
+                    view.consecutive_failures,
+                    view.max_consecutive_failures,
+                    outcome,
                 )
-                return self.data or {}
+            elif view.consecutive_failures == view.max_consecutive_failures:
+                _LOGGER.error("KECO API error for %s, marking it unavailable: %s", view.stat_id, outcome)
+
+        for entry_id in changed_entries:
+            self._async_save_state(entry_id)
+        self._cycle_phases["merge"] = perf_counter() - fetched
+
+        if last_error is not None and not any(view.available for view in self.stations.values()):
+            raise UpdateFailed(str(last_error)) from last_error
+
+        self._schedule_next_poll()
+        return data
+
+    async def async_shutdown(self) -> None:
+        for task in self.restore_refreshes:
+            task.cancel()
+        await super().async_shutdown()
+
+    @callback
+    def async_update_listeners(self) -> None:
+        started = perf_counter()
+        super().async_update_listeners()
+        rendered = perf_counter()
+        # After the state writes, so automations triggered by an event see the new states.
+        events, self._pending_events = self._pending_events, []
+        for event_data in events:
+            self.hass.bus.async_fire(EVENT_STATUS_CHANGED, event_data)
+
+        if self._cycle_started is not None:
+            phases = {**self._cycle_phases, "listeners": rendered - started, "events": perf_counter() - rendered}
+            self.profiler.end_cycle(self._log_name, perf_counter() - self._cycle_started, phases)
+            self._cycle_started = None
+
+    def _schedule_next_poll(self) -> None:
+        views = self.stations.values()
+        transitions = any(view.status_changed for view in views)
+        charging = any(view.summary.charging for view in views)
+
+        current = self.update_interval.total_seconds() if self.update_interval else self._base_interval
+        if transitions or charging:
+            self._idle_polls = 0
+            interval = ACTIVE_UPDATE_INTERVAL
+        else:
+            self._idle_polls += 1
+            if self._idle_polls >= IDLE_POLLS_BEFORE_BACKOFF:
+                interval = min(MAX_UPDATE_INTERVAL, max(current, self._base_interval) * 2)
+            else:
+                interval = max(current, self._base_interval)
+        if self.zone_poller is not None and self.zone_poller.has_polled_zones():
+            # Backing off past the delta feed's reach would make every poll a full zone download.
+            interval = min(interval, ZONE_POLL_MAX_INTERVAL)
 
-            raise UpdateFailed(str(err)) from err
+        if self.budget is not None:
+            interval = max(interval, self.budget.min_interval(self._requests_per_cycle))
+        # Set before the coordinator schedules its next refresh.
+        self.update_interval = timedelta(seconds=round(interval))
@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+from typing import Any
+
+import voluptuous as vol
+from homeassistant.components.device_automation import DEVICE_TRIGGER_BASE_SCHEMA
+from homeassistant.const import CONF_DEVICE_ID, CONF_DOMAIN, CONF_PLATFORM, CONF_TYPE
+from homeassistant.core import CALLBACK_TYPE, Event, HassJob, HomeAssistant, callback
+from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers.trigger import TriggerActionType, TriggerInfo
+from homeassistant.helpers.typing import ConfigType
+
+from .const import DOMAIN, EVENT_STATUS_CHANGED
+from .models import STAT_AVAILABLE, STAT_CHARGING, STATS_FAULTED
+
+# Trigger type -> `stat` values it fires on entering (None: any change). On a
+# station device the trigger covers every charger of the station.
+TRIGGER_STATS: dict[str, frozenset[str] | None] = {
+    "status_changed": None,
+    "became_available": frozenset({STAT_AVAILABLE}),
+    "charging_started": frozenset({STAT_CHARGING}),
+    "faulted": STATS_FAULTED,
+}
+
+TRIGGER_SCHEMA = DEVICE_TRIGGER_BASE_SCHEMA.extend({vol.Required(CONF_TYPE): vol.In(TRIGGER_STATS)})
+
+
+def _device_target(hass: HomeAssistant, device_id: str) -> tuple[str, str | None] | None:
+    # Device identifiers are statId (station) or statId_chgerId (charger); see sensor.py.
+    device = dr.async_get(hass).async_get(device_id)
+    if device is None:
+        return None
+    for domain, identifier in device.identifiers:
+        if domain != DOMAIN:
+            continue
+        stat_id, _, chger_id = identifier.partition("_")
+        return stat_id, chger_id or None
+    return None
+
+
+async def async_get_triggers(hass: HomeAssistant, device_id: str) -> list[dict[str, Any]]:
+    if _device_target(hass, device_id) is None:
+        return []
+    return [
+        {CONF_PLATFORM: "device", CONF_DOMAIN: DOMAIN, CONF_DEVICE_ID: device_id, CONF_TYPE: trigger_type}
+        for trigger_type in TRIGGER_STATS
+    ]
+
+
+async def async_attach_trigger(
+    hass: HomeAssistant,
+    config: ConfigType,
+    action: TriggerActionType,
+    trigger_info: TriggerInfo,
+) -> CALLBACK_TYPE:
+    target = _device_target(hass, config[CONF_DEVICE_ID])
+    if target is None:
+        raise vol.Invalid(f"Device {config[CONF_DEVICE_ID]} is not a KECO EV Charger device")
+    stat_id, chger_id = target
+    trigger_type = config[CONF_TYPE]
+    stats = TRIGGER_STATS[trigger_type]
+    trigger_data = trigger_info["trigger_data"]
+    job = HassJob(action, f"keco_evcharger device trigger {trigger_info}")
+
+    # One bus listener per trigger; it only runs when a charger actually changed.
+    @callback
+    def handle_event(event: Event) -> None:
+        data = event.data
+        if data["stat_id"] != stat_id or (chger_id is not None and data["chger_id"] != chger_id):
+            return
+        if stats is not None and (data["new_stat"] not in stats or data["old_stat"] in stats):
+            return
+        hass.async_run_hass_job(
+            job,
+            {
+                "trigger": {
+                    **trigger_data,
+                    **config,
+                    "event": event,
+                    "description": f"{trigger_type} at {stat_id} #{data['chger_id']}",
+                }
+            },
+            event.context,
+        )
+
+    return hass.bus.async_listen(EVENT_STATUS_CHANGED, handle_event)
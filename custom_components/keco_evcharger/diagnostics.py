@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import CONF_API_KEY, CONF_ZCODE, DOMAIN
+
+TO_REDACT = {CONF_API_KEY}
+
+
+async def async_get_config_entry_diagnostics(hass: HomeAssistant, entry: ConfigEntry) -> dict[str, Any]:
+    data = hass.data[DOMAIN][entry.entry_id]
+    coordinator = data["coordinator"]
+    interval = coordinator.update_interval
+
+    stations: dict[str, Any] = {}
+    for view in data["stations"]:
+        zcode = view.station.get(CONF_ZCODE, "")
+        stations[view.stat_id] = {
+            "available": view.available,
+            "consecutive_failures": view.consecutive_failures,
+            "chargers": len(view.rows_by_chger_id),
+        }
+        if coordinator.zone_poller is not None and zcode:
+            stations[view.stat_id]["zone_polled"] = coordinator.zone_poller.is_polled(zcode)
+
+    out: dict[str, Any] = {
+        "entry": async_redact_data(entry.as_dict(), TO_REDACT),
+        # The coordinator, client and breaker are shared by every entry using the same API key.
+        "coordinator": {
+            "last_update_success": coordinator.last_update_success,
+            "update_interval": interval.total_seconds() if interval else None,
+            "stations_total": len(coordinator.stations),
+            "requests_per_cycle": coordinator._requests_per_cycle,
+            "state_writes": coordinator.state_writes,
+            "state_writes_skipped": coordinator.state_writes_skipped,
+        },
+        "stations": stations,
+        "client": data["client"].stats.as_dict(),
+        "circuit_breaker": data["client"].breaker.as_dict(),
+        "scheduler": data["client"].scheduler.as_dict(),
+        "profiler": coordinator.profiler.as_dict(),
+    }
+    if coordinator.budget is not None:
+        out["budget"] = {
+            "daily_request_budget": coordinator.budget.daily_budget,
+            "requests_today": coordinator.client.stats.requests_today,
+            "min_interval": round(coordinator.budget.min_interval(coordinator._requests_per_cycle), 1),
+        }
+    return out
@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+import asyncio
+import csv
+import gzip
+import io
+import json
+import logging
+import os
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+
+from .api import KecoApiClient
+from .const import EXPORT_DIR, EXPORT_ZONE_CONCURRENCY
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+_LOGGER = logging.getLogger(__name__)
+
+# getChargerInfo columns, in upstream order, for the csv format. Keys missing from
+# a row are written empty; keys not listed here are dropped.
+CSV_FIELDS = (
+    "statNm", "statId", "chgerId", "chgerType", "addr", "location", "useTime",
+    "lat", "lng", "busiId", "bnm", "busiNm", "busiCall", "stat", "statUpdDt",
+    "lastTsdt", "lastTedt", "nowTsdt", "output", "method", "zcode", "zscode",
+    "kind", "kindDetail", "parkingFree", "note", "limitYn", "limitDetail",
+    "delYn", "delDetail", "trafficYn", "powerType",
+)  # fmt: skip
+
+
+def _encode_ndjson(rows: list[dict[str, Any]]) -> bytes:
+    if orjson is not None:
+        return b"".join(orjson.dumps(row) + b"\n" for row in rows)
+    return "".join(json.dumps(row, ensure_ascii=False) + "\n" for row in rows).encode()
+
+
+def _encode_csv(rows: list[dict[str, Any]], header: bool) -> bytes:
+    buf = io.StringIO()
+    writer = csv.DictWriter(buf, CSV_FIELDS, extrasaction="ignore", lineterminator="\n")
+    if header:
+        writer.writeheader()
+    writer.writerows(rows)
+    return buf.getvalue().encode()
+
+
+class _ZoneFile:
+    """Blocking writer for one zone's export; every method runs in the executor.
+
+    Rows go to `<zcode>.<fmt>.gz.part`, one gzip member per page (concatenated
+    members are a valid gzip stream). After each page the checkpoint records the
+    file size, so a resumed run truncates a half-written page and appends from the
+    next one. finish() renames the file into place.
+    """
+
+    def __init__(self, directory: str, zcode: str, fmt: str) -> None:
+        self.fmt = fmt
+        self.path = os.path.join(directory, f"{zcode}.{fmt}.gz")
+        self._part = f"{self.path}.part"
+        self._checkpoint = os.path.join(directory, f"{zcode}.checkpoint.json")
+        self.rows = 0
+        self.pages = 0
+        self._offset = 0
+
+    def _read_checkpoint(self) -> dict[str, Any] | None:
+        try:
+            with open(self._checkpoint, encoding="utf-8") as fp:
+                state = json.load(fp)
+        except (OSError, ValueError):
+            return None
+        return state if state.get("format") == self.fmt else None
+
+    def _write_checkpoint(self, **state: Any) -> None:
+        tmp = f"{self._checkpoint}.tmp"
+        with open(tmp, "w", encoding="utf-8") as fp:
+            json.dump({"format": self.fmt, "rows": self.rows, "pages": self.pages, **state}, fp)
+        os.replace(tmp, self._checkpoint)
+
+    def is_complete(self) -> bool:
+        state = self._read_checkpoint()
+        if state is None or not state.get("complete") or not os.path.exists(self.path):
+            return False
+        self.rows, self.pages = state["rows"], state["pages"]
+        return True
+
+    def open(self, resume: bool) -> int:
+        """Prepare the part file; return the first page to fetch."""
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        state = self._read_checkpoint() if resume else None
+        if state is not None and not state.get("complete") and os.path.exists(self._part):
+            self.rows, self.pages, self._offset = state["rows"], state["pages"], state["offset"]
+            with open(self._part, "r+b") as fp:
+                fp.truncate(self._offset)
+            return state["page"] + 1
+        with open(self._part, "wb"):
+            pass
+        return 1
+
+    def write_page(self, page_no: int, pages: int, rows: list[dict[str, Any]]) -> None:
+        if self.fmt == "csv":
+            data = _encode_csv(rows, header=self._offset == 0)
+        else:
+            data = _encode_ndjson(rows)
+        with open(self._part, "ab") as raw:
+            with gzip.GzipFile(fileobj=raw, mode="wb", mtime=0) as gz:
+                gz.write(data)
+            raw.flush()
+            os.fsync(raw.fileno())
+            self._offset = raw.tell()
+        self.rows += len(rows)
+        self.pages = pages
+        self._write_checkpoint(page=page_no, offset=self._offset)
+
+    def finish(self) -> None:
+        if self._offset == 0 and self.fmt == "csv":
+            # Empty zone: still a readable file with the header.
+            self.write_page(0, 0, [])
+        os.replace(self._part, self.path)
+        self._write_checkpoint(complete=True)
+
+    def clear_checkpoint(self) -> None:
+        try:
+            os.remove(self._checkpoint)
+        except FileNotFoundError:
+            pass
+
+
+async def _async_export_zone(
+    hass: HomeAssistant, client: KecoApiClient, zone: _ZoneFile, zcode: str, resume: bool
+) -> dict[str, Any]:
+    if resume and await hass.async_add_executor_job(zone.is_complete):
+        return {"path": zone.path, "rows": zone.rows, "pages": zone.pages, "skipped": True}
+    start = await hass.async_add_executor_job(zone.open, resume)
+    if start > 1:
+        _LOGGER.info("Resuming export of zcode %s from page %s", zcode, start)
+    async for page_no, pages, rows in client.iter_zone_chargers(zcode, start_page=start):
+        await hass.async_add_executor_job(zone.write_page, page_no, pages, rows)
+    await hass.async_add_executor_job(zone.finish)
+    return {"path": zone.path, "rows": zone.rows, "pages": zone.pages, "resumed_from_page": start if start > 1 else None}
+
+
+async def async_export_zones(
+    hass: HomeAssistant, client: KecoApiClient, zcodes: list[str], fmt: str, resume: bool = True
+) -> dict[str, Any]:
+    """Export every getChargerInfo row of the zones to gzip files under the config dir.
+
+    A failed zone keeps its checkpoint; with `resume` a later run continues it and
+    skips the zones this set already finished. Checkpoints are removed once every
+    zone of the run succeeded, so the next run starts over.
+    """
+    directory = hass.config.path(EXPORT_DIR)
+    zones = {zcode: _ZoneFile(directory, zcode, fmt) for zcode in zcodes}
+    semaphore = asyncio.Semaphore(EXPORT_ZONE_CONCURRENCY)
+
+    async def run(zcode: str) -> dict[str, Any]:
+        async with semaphore:
+            return await _async_export_zone(hass, client, zones[zcode], zcode, resume)
+
+    results = await asyncio.gather(*(run(zcode) for zcode in zcodes), return_exceptions=True)
+    out: dict[str, Any] = {}
+    for zcode, result in zip(zcodes, results):
+        if isinstance(result, BaseException):
+            _LOGGER.warning("Export of zcode %s failed: %s", zcode, result)
+            out[zcode] = {"error": str(result) or type(result).__name__}
+        else:
+            out[zcode] = result
+    if all("error" not in result for result in out.values()):
+        for zone in zones.values():
+            await hass.async_add_executor_job(zone.clear_checkpoint)
+    return out
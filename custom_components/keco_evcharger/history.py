@@ -0,0 +1,263 @@
+from __future__ import annotations
+
+from array import array
+from datetime import datetime
+import time
+from typing import Any, Iterator
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from .const import (
+    HISTORY_SAVE_DELAY,
+    HISTORY_SESSIONS,
+    HISTORY_STORAGE_KEY,
+    HISTORY_STORAGE_VERSION,
+    HISTORY_TRANSITIONS,
+)
+from .models import STAT_AVAILABLE, STAT_CHARGING, ChargerState
+
+_HOURS_PER_WEEK = 168
+_CHARGING = int(STAT_CHARGING)
+_AVAILABLE = int(STAT_AVAILABLE)
+# Epoch 1970-01-01 was a Thursday; shifts hour-of-week so that 0 is Monday 00:00
+# Korea time (models.KST is UTC+9 all year, so a fixed offset works here and
+# hour boundaries match UTC ones).
+_WEEK_OFFSET = 3 * 24 * 3600 + 9 * 3600
+
+
+class _Ring:
+    """Fixed-capacity ring of parallel typed arrays (one per column)."""
+
+    __slots__ = ("capacity", "_columns", "_start")
+
+    def __init__(self, capacity: int, typecodes: str) -> None:
+        self.capacity = capacity
+        # Grown on append up to capacity, then overwritten oldest-first.
+        self._columns = tuple(array(code) for code in typecodes)
+        self._start = 0
+
+    def __len__(self) -> int:
+        return len(self._columns[0])
+
+    def append(self, *values: int) -> None:
+        if len(self) < self.capacity:
+            for column, value in zip(self._columns, values):
+                column.append(value)
+            return
+        for column, value in zip(self._columns, values):
+            column[self._start] = value
+        self._start = (self._start + 1) % self.capacity
+
+    def last(self) -> tuple[int, ...] | None:
+        if not len(self):
+            return None
+        pos = (self._start - 1) % len(self)
+        return tuple(column[pos] for column in self._columns)
+
+    def __iter__(self) -> Iterator[tuple[int, ...]]:
+        size = len(self)
+        for i in range(size):
+            pos = (self._start + i) % size
+            yield tuple(column[pos] for column in self._columns)
+
+    def as_lists(self) -> list[list[int]]:
+        return [[row[i] for row in self] for i in range(len(self._columns))]
+
+    @classmethod
+    def from_lists(cls, capacity: int, typecodes: str, lists: list[list[int]]) -> _Ring:
+        ring = cls(capacity, typecodes)
+        for values in zip(*lists):
+            ring.append(*values)
+        return ring
+
+
+def _stat_code(stat: str) -> int:
+    return int(stat) if stat.isdigit() and len(stat) == 1 else 0
+
+
+def _epoch(dt: datetime | None) -> int | None:
+    return int(dt.timestamp()) if dt is not None else None
+
+
+class ChargerHistory:
+    """`stat` transitions and finished sessions of one charger.
+
+    transitions: (epoch seconds, stat code); the state holds until the next row.
+    sessions: (end epoch seconds, length in seconds).
+    """
+
+    __slots__ = ("transitions", "sessions")
+
+    def __init__(self) -> None:
+        self.transitions = _Ring(HISTORY_TRANSITIONS, "qB")
+        self.sessions = _Ring(HISTORY_SESSIONS, "qI")
+
+    def record(self, old: ChargerState | None, new: ChargerState, now: int) -> bool:
+        changed = False
+        code = _stat_code(new.stat)
+        last = self.transitions.last()
+        if last is None or last[1] != code:
+            at = _epoch(new.stat_upd_dt) or now
+            # Upstream timestamps can lag our clock or the previous row; keep order.
+            self.transitions.append(max(at, last[0]) if last else at, code)
+            changed = True
+
+        ended = _epoch(new.last_tedt)
+        if old is not None and ended is not None and ended != _epoch(old.last_tedt):
+            started = _epoch(old.now_tsdt) or _epoch(new.last_tsdt)
+            last_session = self.sessions.last()
+            if started is not None and ended > started and (last_session is None or last_session[0] != ended):
+                self.sessions.append(ended, ended - started)
+                changed = True
+        return changed
+
+    def _intervals(self, start: int, end: int) -> Iterator[tuple[int, int, int]]:
+        # (from, to, stat code) clipped to [start, end).
+        previous: tuple[int, ...] | None = None
+        for at, code in self.transitions:
+            if previous is not None:
+                lo, hi = max(previous[0], start), min(at, end)
+                if lo < hi:
+                    yield lo, hi, previous[1]
+            previous = (at, code)
+        if previous is not None:
+            lo = max(previous[0], start)
+            if lo < end:
+                yield lo, end, previous[1]
+
+    def statistics(self, start: int, end: int, profile: bool = True) -> dict[str, Any]:
+        observed = charging = available = 0
+        hour_seen = array("d", bytes(8 * _HOURS_PER_WEEK))
+        hour_free = array("d", bytes(8 * _HOURS_PER_WEEK))
+        for lo, hi, code in self._intervals(start, end):
+            span = hi - lo
+            observed += span
+            if code == _CHARGING:
+                charging += span
+            free = code == _AVAILABLE
+            if free:
+                available += span
+            if not profile:
+                continue
+            # Split across hour boundaries for the hour-of-week profile.
+            t = lo
+            while t < hi:
+                boundary = min(hi, (t // 3600 + 1) * 3600)
+                bucket = ((t + _WEEK_OFFSET) // 3600) % _HOURS_PER_WEEK
+                hour_seen[bucket] += boundary - t
+                if free:
+                    hour_free[bucket] += boundary - t
+                t = boundary
+
+        lengths = [length for ended, length in self.sessions if start <= ended < end]
+        stats: dict[str, Any] = {
+            "observed_hours": round(observed / 3600, 2),
+            "occupancy": round(charging / observed, 4) if observed else None,
+            "availability": round(available / observed, 4) if observed else None,
+            "sessions": len(lengths),
+            "avg_session_minutes": round(sum(lengths) / len(lengths) / 60, 1) if lengths else None,
+        }
+        if profile:
+            # Index 0 is Monday 00:00 KST; None where the hour was never observed.
+            stats["hour_of_week_availability"] = [
+                round(hour_free[h] / hour_seen[h], 3) if hour_seen[h] else None for h in range(_HOURS_PER_WEEK)
+            ]
+        return stats
+
+    def as_dict(self) -> dict[str, Any]:
+        return {"transitions": self.transitions.as_lists(), "sessions": self.sessions.as_lists()}
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> ChargerHistory:
+        history = cls()
+        history.transitions = _Ring.from_lists(HISTORY_TRANSITIONS, "qB", data.get("transitions") or [[], []])
+        history.sessions = _Ring.from_lists(HISTORY_SESSIONS, "qI", data.get("sessions") or [[], []])
+        return history
+
+
+# Per station, persisted through Store (one file per statId), so the recorder is
+# never needed for occupancy questions. The delayed save is armed by the first
+# change after a write and not re-armed by later ones: Store.async_delay_save
+# restarts its timer on every call, which would postpone the write indefinitely
+# for a station that changes more often than HISTORY_SAVE_DELAY.
+class StationHistory:
+    def __init__(self, hass: HomeAssistant, stat_id: str) -> None:
+        self.stat_id = stat_id
+        self.chargers: dict[str, ChargerHistory] = {}
+        # Bumped on every recorded change; summary() is cached per revision and minute.
+        self._revision = 0
+        self._summary: tuple[tuple[float, int, int], dict[str, Any]] | None = None
+        # Changes not written yet; a delayed save is pending while set.
+        self.unsaved = False
+        self._store: Store = Store(hass, HISTORY_STORAGE_VERSION, f"{HISTORY_STORAGE_KEY}_{stat_id}")
+
+    async def async_load(self) -> None:
+        data = await self._store.async_load() or {}
+        self.chargers = {
+            chger_id: ChargerHistory.from_dict(charger) for chger_id, charger in data.get("chargers", {}).items()
+        }
+
+    @callback
+    def record(self, old: ChargerState | None, new: ChargerState, now: int | None = None) -> None:
+        charger = self.chargers.get(new.chger_id)
+        if charger is None:
+            charger = self.chargers[new.chger_id] = ChargerHistory()
+        if charger.record(old, new, int(time.time()) if now is None else now):
+            self._revision += 1
+            if not self.unsaved:
+                self.unsaved = True
+                self._store.async_delay_save(self._data_to_save, HISTORY_SAVE_DELAY)
+
+    async def async_save(self) -> None:
+        """Write now, replacing a pending delayed save (on unload, before a reload loads it)."""
+        await self._store.async_save(self._data_to_save())
+
+    async def async_remove(self) -> None:
+        await self._store.async_remove()
+
+    def _data_to_save(self) -> dict[str, Any]:
+        # Called by Store at write time, so a later change arms a new save.
+        self.unsaved = False
+        return {"chargers": {chger_id: charger.as_dict() for chger_id, charger in self.chargers.items()}}
+
+    def statistics(
+        self,
+        days: float,
+        chger_ids: list[str] | None = None,
+        now: int | None = None,
+        profile: bool = True,
+    ) -> dict[str, Any]:
+        end = int(time.time()) if now is None else now
+        start = end - int(days * 86400)
+        return {
+            chger_id: charger.statistics(start, end, profile)
+            for chger_id, charger in sorted(self.chargers.items())
+            if chger_ids is None or chger_id in chger_ids
+        }
+
+    def summary(self, days: float, now: int | None = None) -> dict[str, Any]:
+        """Station-wide means over the chargers, for the statistic sensors."""
+        end = int(time.time()) if now is None else now
+        key = (days, end // 60, self._revision)
+        if self._summary is not None and self._summary[0] == key:
+            return self._summary[1]
+        per_charger = self.statistics(days, now=end).values()
+
+        def mean(key: str) -> float | None:
+            values = [stats[key] for stats in per_charger if stats[key] is not None]
+            return sum(values) / len(values) if values else None
+
+        bucket = ((end + _WEEK_OFFSET) // 3600) % _HOURS_PER_WEEK
+        hour = [
+            stats["hour_of_week_availability"][bucket]
+            for stats in per_charger
+            if stats["hour_of_week_availability"][bucket] is not None
+        ]
+        summary = {
+            "occupancy": mean("occupancy"),
+            "avg_session_minutes": mean("avg_session_minutes"),
+            "hour_availability": sum(hour) / len(hour) if hour else None,
+        }
+        self._summary = (key, summary)
+        return summary
@@ -0,0 +1,196 @@
+from __future__ import annotations
+
+from dataclasses import asdict, dataclass, fields, replace
+from datetime import datetime
+from functools import lru_cache
+import sys
+from typing import Any
+from zoneinfo import ZoneInfo
+
+from .const import STATUS_FIELDS
+
+# KECO timestamps are local Korea time (HA timestamp sensors need aware datetimes),
+# and data.go.kr daily quotas reset at midnight Korea time.
+KST = ZoneInfo("Asia/Seoul")
+
+
+@lru_cache(maxsize=4096)
+def _parse_ts_str(raw: str) -> datetime | None:
+    # Fixed YYYYmmddHHMMSS: slicing is far cheaper than strptime. Most values repeat
+    # between polls (lastTsdt/lastTedt rarely change), hence the cache.
+    if len(raw) != 14 or not raw.isascii() or not raw.isdigit():
+        return None
+    try:
+        return datetime(
+            int(raw[0:4]),
+            int(raw[4:6]),
+            int(raw[6:8]),
+            int(raw[8:10]),
+            int(raw[10:12]),
+            int(raw[12:14]),
+            tzinfo=KST,
+        )
+    except ValueError:
+        # Includes the all-zero placeholder upstream sends for "no timestamp".
+        return None
+
+
+def parse_ts(v: Any) -> datetime | None:
+    if not v:
+        return None
+    return _parse_ts_str(str(v).strip())
+
+
+_TIMESTAMP_ATTRS = {
+    "statUpdDt": "stat_upd_dt",
+    "lastTsdt": "last_tsdt",
+    "lastTedt": "last_tedt",
+    "nowTsdt": "now_tsdt",
+}
+
+_TIMESTAMP_FIELDS = frozenset(_TIMESTAMP_ATTRS.values())
+
+
+def _text(row: dict[str, Any], key: str) -> str:
+    return str(row.get(key) or "").strip()
+
+
+def _interned(row: dict[str, Any], key: str) -> str:
+    # Station-level strings repeat for every charger at a station (and every poll).
+    return sys.intern(_text(row, key))
+
+
+# One charger as kept by the coordinator. Built once per upstream row; zone status
+# rows produce a copy via with_status(). Equality compares all fields.
+@dataclass(frozen=True, slots=True)
+class ChargerState:
+    stat_id: str
+    chger_id: str
+    stat_nm: str = ""
+    addr: str = ""
+    busi_nm: str = ""
+    zcode: str = ""
+    chger_type: str = ""
+    output: str = ""
+    method: str = ""
+    stat: str = ""
+    stat_upd_dt: datetime | None = None
+    last_tsdt: datetime | None = None
+    last_tedt: datetime | None = None
+    now_tsdt: datetime | None = None
+
+    @classmethod
+    def from_row(cls, row: dict[str, Any]) -> ChargerState:
+        return cls(
+            stat_id=_interned(row, "statId"),
+            chger_id=_interned(row, "chgerId"),
+            stat_nm=_interned(row, "statNm"),
+            addr=_interned(row, "addr"),
+            busi_nm=_interned(row, "busiNm"),
+            zcode=_interned(row, "zcode"),
+            chger_type=_interned(row, "chgerType"),
+            output=_interned(row, "output"),
+            method=_interned(row, "method"),
+            stat=_interned(row, "stat"),
+            stat_upd_dt=parse_ts(row.get("statUpdDt")),
+            last_tsdt=parse_ts(row.get("lastTsdt")),
+            last_tedt=parse_ts(row.get("lastTedt")),
+            now_tsdt=parse_ts(row.get("nowTsdt")),
+        )
+
+    def with_status(self, status: dict[str, Any]) -> ChargerState:
+        # getChargerStatus rows carry only the STATUS_FIELDS subset.
+        changes: dict[str, Any] = {}
+        for key in STATUS_FIELDS:
+            if key not in status:
+                continue
+            if key == "stat":
+                changes["stat"] = _interned(status, "stat")
+            else:
+                changes[_TIMESTAMP_ATTRS[key]] = parse_ts(status[key])
+        return replace(self, **changes)
+
+    def as_dict(self) -> dict[str, Any]:
+        # JSON-serialisable form for the coordinator's state Store.
+        data = asdict(self)
+        for attr in _TIMESTAMP_ATTRS.values():
+            if data[attr] is not None:
+                data[attr] = data[attr].isoformat()
+        return data
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> ChargerState:
+        values: dict[str, Any] = {}
+        for f in fields(cls):
+            if f.name not in data:
+                continue
+            value = data[f.name]
+            if f.name in _TIMESTAMP_FIELDS:
+                value = datetime.fromisoformat(value) if value else None
+            else:
+                value = sys.intern(str(value))
+            values[f.name] = value
+        return cls(**values)
+
+
+STAT_AVAILABLE = "2"
+STAT_CHARGING = "3"
+# 통신이상 / 운영중지 / 점검중
+STATS_FAULTED = frozenset({"1", "4", "5"})
+
+
+def _output_kw(state: ChargerState) -> float | None:
+    try:
+        return float(state.output) if state.output else None
+    except ValueError:
+        return None
+
+
+# Station-level counts kept up to date from changed rows only (see
+# KecoCoordinator), so aggregate sensors never iterate chargers or entities.
+class StationSummary:
+    __slots__ = ("available", "charging", "faulted", "full_since", "_free_outputs", "_changed_at")
+
+    def __init__(self) -> None:
+        self.available = 0
+        self.charging = 0
+        self.faulted = 0
+        # When the last free charger was taken; None while one is free.
+        self.full_since: datetime | None = None
+        # output kW -> number of free chargers with that output
+        self._free_outputs: dict[float, int] = {}
+        self._changed_at: datetime | None = None
+
+    @property
+    def fastest_free_output(self) -> float | None:
+        return max(self._free_outputs, default=None)
+
+    def _count(self, state: ChargerState, sign: int) -> None:
+        if state.stat == STAT_AVAILABLE:
+            self.available += sign
+            output = _output_kw(state)
+            if output is not None:
+                remaining = self._free_outputs.get(output, 0) + sign
+                if remaining > 0:
+                    self._free_outputs[output] = remaining
+                else:
+                    self._free_outputs.pop(output, None)
+        elif state.stat == STAT_CHARGING:
+            self.charging += sign
+        elif state.stat in STATS_FAULTED:
+            self.faulted += sign
+
+    def apply(self, old: ChargerState | None, new: ChargerState) -> None:
+        if old is not None:
+            self._count(old, -1)
+        self._count(new, 1)
+        if new.stat_upd_dt is not None and (self._changed_at is None or new.stat_upd_dt > self._changed_at):
+            self._changed_at = new.stat_upd_dt
+
+    def commit(self, now: datetime) -> None:
+        # Called once per update after apply(); dates a "became full" transition.
+        if self.available:
+            self.full_since = None
+        elif self.full_since is None:
+            self.full_since = self._changed_at or now
+        self._changed_at = None
@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+import cProfile
+import logging
+import os
+import pstats
+from time import perf_counter
+from typing import Any, Callable, TypeVar
+
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.util import dt as dt_util
+
+from .const import DEFAULT_SLOW_CYCLE_THRESHOLD, PROFILE_DIR, PROFILE_TOP_FUNCTIONS
+
+_LOGGER = logging.getLogger(__name__)
+
+_T = TypeVar("_T")
+
+
+class SpanStats:
+    __slots__ = ("count", "total", "max")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, seconds: float) -> None:
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "count": self.count,
+            "total": round(self.total, 4),
+            "avg": round(self.total / self.count, 6) if self.count else 0.0,
+            "max": round(self.max, 4),
+        }
+
+
+# One per coordinator (so per API key). Coordinator phases are timed every cycle,
+# which costs a few clock reads, for the slow-cycle log. Finer spans (HTTP, JSON
+# decode, entity rendering) are only taken while `enabled`; call sites check the
+# attribute first so the disabled path is a single attribute read.
+class KecoProfiler:
+    def __init__(self) -> None:
+        self.enabled = False
+        self.slow_cycle_threshold = float(DEFAULT_SLOW_CYCLE_THRESHOLD)
+        self.spans: dict[str, SpanStats] = {}
+        self.cycles = 0
+        self.slow_cycles = 0
+        # Entry options: consumer -> (enabled, slow cycle threshold).
+        self._options: dict[object, tuple[bool, float]] = {}
+        # Set through the set_profiling service; wins over the entry options.
+        self._override: bool | None = None
+        self._cycle: dict[str, float] = {}
+
+    def register(self, consumer: object, enabled: bool, slow_cycle_threshold: float) -> None:
+        self._options[consumer] = (bool(enabled), float(slow_cycle_threshold))
+        self._apply()
+
+    def unregister(self, consumer: object) -> None:
+        self._options.pop(consumer, None)
+        self._apply()
+
+    def set_override(self, enabled: bool | None) -> None:
+        self._override = enabled
+        self._apply()
+
+    def _apply(self) -> None:
+        if self._override is not None:
+            self.enabled = self._override
+        else:
+            self.enabled = any(enabled for enabled, _ in self._options.values())
+        # Entries may carry different options for the same key; the strictest wins.
+        # 0 turns the log off for one entry only, so it applies when every entry has it.
+        thresholds = [threshold for _, threshold in self._options.values()]
+        if not thresholds:
+            self.slow_cycle_threshold = float(DEFAULT_SLOW_CYCLE_THRESHOLD)
+        else:
+            self.slow_cycle_threshold = min((threshold for threshold in thresholds if threshold), default=0.0)
+
+    def add(self, name: str, seconds: float) -> None:
+        stats = self.spans.get(name)
+        if stats is None:
+            stats = self.spans[name] = SpanStats()
+        stats.add(seconds)
+        self._cycle[name] = self._cycle.get(name, 0.0) + seconds
+
+    def timed(self, name: str, func: Callable[..., _T], *args: Any) -> _T:
+        started = perf_counter()
+        try:
+            return func(*args)
+        finally:
+            self.add(name, perf_counter() - started)
+
+    def end_cycle(self, name: str, total: float, phases: dict[str, float]) -> None:
+        """Close one coordinator cycle: keep its phases and log it if slow."""
+        self.cycles += 1
+        if self.enabled:
+            self.add("cycle", total)
+            for phase, seconds in phases.items():
+                self.add(phase, seconds)
+        spans, self._cycle = self._cycle, {}
+        if not self.slow_cycle_threshold or total < self.slow_cycle_threshold:
+            return
+        self.slow_cycles += 1
+        # Without profiling only the coordinator phases are known.
+        breakdown = spans if self.enabled else phases
+        _LOGGER.warning(
+            "%s update cycle took %.2fs (%s)",
+            name,
+            total,
+            ", ".join(f"{span} {seconds:.3f}s" for span, seconds in sorted(breakdown.items()) if span != "cycle"),
+        )
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "enabled": self.enabled,
+            "slow_cycle_threshold": self.slow_cycle_threshold,
+            "cycles": self.cycles,
+            "slow_cycles": self.slow_cycles,
+            "spans": {name: stats.as_dict() for name, stats in sorted(self.spans.items())},
+        }
+
+
+def _write_profile(profile: cProfile.Profile, path: str) -> list[dict[str, Any]]:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    profile.dump_stats(path)
+    stats = pstats.Stats(profile).stats  # type: ignore[attr-defined]
+    top = sorted(stats.items(), key=lambda item: item[1][2], reverse=True)[:PROFILE_TOP_FUNCTIONS]
+    return [
+        {
+            "function": f"{func} ({os.path.basename(filename)}:{line})",
+            "calls": calls,
+            "tottime": round(tottime, 4),
+            "cumtime": round(cumtime, 4),
+        }
+        for (filename, line, func), (_, calls, tottime, cumtime, _) in top
+    ]
+
+
+async def async_profile_cycles(hass: HomeAssistant, coordinators: list[Any], cycles: int) -> dict[str, Any]:
+    """Run `cycles` refreshes of the coordinators under cProfile and dump the stats.
+
+    The profile covers the whole event loop thread while it runs, not only this
+    integration. The .prof file goes to <config>/PROFILE_DIR for pstats/snakeviz.
+    """
+    profile = cProfile.Profile()
+    try:
+        profile.enable()
+    except ValueError as err:
+        # Only one profiler can be active per thread (e.g. HA's profiler integration).
+        raise HomeAssistantError(f"Cannot start profiling: {err}") from err
+    started = perf_counter()
+    try:
+        for _ in range(cycles):
+            for coordinator in coordinators:
+                await coordinator.async_refresh()
+    finally:
+        profile.disable()
+    seconds = perf_counter() - started
+
+    path = hass.config.path(PROFILE_DIR, f"cycles_{dt_util.now().strftime('%Y%m%d_%H%M%S')}.prof")
+    top = await hass.async_add_executor_job(_write_profile, profile, path)
+    return {"path": path, "cycles": cycles, "seconds": round(seconds, 3), "top": top}
@@ -1,38 +1,26 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from datetime import datetime
-from zoneinfo import ZoneInfo
 from typing import Any, Callable
 
 from homeassistant.components.sensor import SensorEntity, SensorEntityDescription
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.const import EntityCategory
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import device_registry as dr, entity_registry as er
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import CONF_ENABLED_CHARGERS, CONF_STAT_ID, CONF_STAT_NM, DOMAIN, STAT_TEXT
-from .coordinator import KecoCoordinator
-
-
-def _parse_ts(v: str | None) -> datetime | None:
-    if not v:
-        return None
-    raw = str(v).strip()
-    if not raw or raw in {"0", "00000000000000"}:
-        return None
-    try:
-        # KECO timestamp payload is local Korea time (YYYYmmddHHMMSS).
-        # Home Assistant timestamp sensors need timezone-aware datetime.
-        dt = datetime.strptime(raw, "%Y%m%d%H%M%S")
-        return dt.replace(tzinfo=ZoneInfo("Asia/Seoul"))
-    except ValueError:
-        return None
+from . import async_key_sensor_owner
+from .const import CONF_API_KEY, CONF_BUSI_NM, CONF_ENABLED_CHARGERS, DOMAIN, HISTORY_SENSOR_DAYS, STAT_TEXT
+from .api import KecoApiClient
+from .coordinator import KecoCoordinator, KecoStationView
+from .models import ChargerState, StationSummary
 
 
 @dataclass(frozen=True, kw_only=True)
 class KecoSensorDescription(SensorEntityDescription):
-    value_fn: Callable[[dict[str, Any]], Any]
+    value_fn: Callable[[ChargerState], Any]
     enabled_default: bool = True
 
 
@@ -40,46 +28,46 @@ SENSOR_TYPES: tuple[KecoSensorDescription, ...] = (
     KecoSensorDescription(
         key="status_text",
         name="상태",
-        value_fn=lambda d: STAT_TEXT.get(str(d.get("stat", "")), f"미정의({d.get('stat', '')})"),
+        value_fn=lambda d: STAT_TEXT.get(d.stat, f"미정의({d.stat})"),
         icon="mdi:ev-station",
     ),
     KecoSensorDescription(
         key="status_code",
         name="상태 코드",
-        value_fn=lambda d: str(d.get("stat", "")),
+        value_fn=lambda d: d.stat,
         enabled_default=False,
         icon="mdi:code-tags",
     ),
     KecoSensorDescription(
         key="stat_upd_dt",
         name="상태 갱신 시각",
-        value_fn=lambda d: _parse_ts(d.get("statUpdDt")),
+        value_fn=lambda d: d.stat_upd_dt,
         device_class="timestamp",
     ),
     KecoSensorDescription(
         key="now_tsdt",
         name="현재 충전 시작 시각",
-        value_fn=lambda d: _parse_ts(d.get("nowTsdt")),
+        value_fn=lambda d: d.now_tsdt,
         device_class="timestamp",
     ),
     KecoSensorDescription(
         key="last_tsdt",
         name="직전 충전 시작 시각",
-        value_fn=lambda d: _parse_ts(d.get("lastTsdt")),
+        value_fn=lambda d: d.last_tsdt,
         device_class="timestamp",
         enabled_default=False,
     ),
     KecoSensorDescription(
         key="last_tedt",
         name="직전 충전 종료 시각",
-        value_fn=lambda d: _parse_ts(d.get("lastTedt")),
+        value_fn=lambda d: d.last_tedt,
         device_class="timestamp",
         enabled_default=False,
     ),
     KecoSensorDescription(
         key="output_kw",
         name="출력(kW)",
-        value_fn=lambda d: float(d.get("output")) if str(d.get("output", "")).strip() else None,
+        value_fn=lambda d: float(d.output) if d.output else None,
         native_unit_of_measurement="kW",
         enabled_default=False,
         icon="mdi:flash",
@@ -87,6 +75,156 @@ SENSOR_TYPES: tuple[KecoSensorDescription, ...] = (
 )
 
 
+@dataclass(frozen=True, kw_only=True)
+class KecoStationSensorDescription(SensorEntityDescription):
+    value_fn: Callable[[StationSummary], Any]
+
+
+STATION_SENSOR_TYPES: tuple[KecoStationSensorDescription, ...] = (
+    KecoStationSensorDescription(
+        key="available_count",
+        name="사용 가능 충전기",
+        value_fn=lambda s: s.available,
+        icon="mdi:ev-station",
+    ),
+    KecoStationSensorDescription(
+        key="charging_count",
+        name="충전 중 충전기",
+        value_fn=lambda s: s.charging,
+        icon="mdi:battery-charging",
+    ),
+    KecoStationSensorDescription(
+        key="faulted_count",
+        name="고장/점검 충전기",
+        value_fn=lambda s: s.faulted,
+        icon="mdi:alert",
+    ),
+    KecoStationSensorDescription(
+        key="fastest_free_output",
+        name="사용 가능 최대 출력(kW)",
+        value_fn=lambda s: s.fastest_free_output,
+        native_unit_of_measurement="kW",
+        icon="mdi:flash",
+    ),
+    KecoStationSensorDescription(
+        key="full_since",
+        name="만차 시작 시각",
+        value_fn=lambda s: s.full_since,
+        device_class="timestamp",
+    ),
+)
+
+
+@dataclass(frozen=True, kw_only=True)
+class KecoHistorySensorDescription(SensorEntityDescription):
+    # Receives StationHistory.summary() over the last HISTORY_SENSOR_DAYS days.
+    value_fn: Callable[[dict[str, Any]], Any]
+
+
+def _percent(value: float | None) -> float | None:
+    return round(value * 100, 1) if value is not None else None
+
+
+HISTORY_SENSOR_TYPES: tuple[KecoHistorySensorDescription, ...] = (
+    KecoHistorySensorDescription(
+        key="occupancy",
+        name="충전 점유율",
+        value_fn=lambda s: _percent(s["occupancy"]),
+        native_unit_of_measurement="%",
+        icon="mdi:chart-donut",
+    ),
+    KecoHistorySensorDescription(
+        key="avg_session",
+        name="평균 충전 시간",
+        value_fn=lambda s: round(s["avg_session_minutes"], 1) if s["avg_session_minutes"] is not None else None,
+        native_unit_of_measurement="min",
+        device_class="duration",
+        icon="mdi:timer-sand",
+    ),
+    KecoHistorySensorDescription(
+        key="hour_availability",
+        name="이 시간대 이용 가능률",
+        value_fn=lambda s: _percent(s["hour_availability"]),
+        native_unit_of_measurement="%",
+        icon="mdi:calendar-clock",
+    ),
+)
+
+
+@dataclass(frozen=True, kw_only=True)
+class KecoApiStatsDescription(SensorEntityDescription):
+    value_fn: Callable[[KecoApiClient], Any]
+
+
+# Per API key, created once (see _async_key_entities). Disabled by default.
+API_STATS_TYPES: tuple[KecoApiStatsDescription, ...] = (
+    KecoApiStatsDescription(
+        key="api_requests_today",
+        name="API 요청 수(오늘)",
+        value_fn=lambda c: c.stats.requests_today,
+        icon="mdi:counter",
+    ),
+    KecoApiStatsDescription(
+        key="api_latency_avg",
+        name="API 평균 응답 시간",
+        value_fn=lambda c: round(c.stats.latency_avg * 1000),
+        native_unit_of_measurement="ms",
+        icon="mdi:timer-outline",
+    ),
+    KecoApiStatsDescription(
+        key="api_errors",
+        name="API 오류 수",
+        value_fn=lambda c: sum(e.errors for e in c.stats.endpoints.values()),
+        icon="mdi:alert-circle-outline",
+    ),
+    KecoApiStatsDescription(
+        key="api_queue_wait_avg",
+        name="API 평균 대기 시간",
+        value_fn=lambda c: round(c.scheduler.wait_avg * 1000),
+        native_unit_of_measurement="ms",
+        icon="mdi:tray-full",
+    ),
+)
+
+
+@callback
+def _async_lazy_enabled(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    unique_id: str,
+    name: str,
+    description: SensorEntityDescription,
+    device_info: dict[str, Any],
+) -> bool:
+    """Whether a disabled-by-default sensor should be created.
+
+    Only its registry entry is made up front (disabled, so it can be enabled from
+    the UI). Enabling it makes Home Assistant reload the entry, and the next setup
+    creates the entity.
+    """
+    registry = er.async_get(hass)
+    entity_id = registry.async_get_entity_id("sensor", DOMAIN, unique_id)
+    if entity_id is not None:
+        return not registry.async_get(entity_id).disabled
+
+    device = dr.async_get(hass).async_get_or_create(config_entry_id=entry.entry_id, **device_info)
+    registry.async_get_or_create(
+        "sensor",
+        DOMAIN,
+        unique_id,
+        config_entry=entry,
+        device_id=device.id,
+        disabled_by=er.RegistryEntryDisabler.INTEGRATION,
+        entity_category=description.entity_category,
+        original_device_class=description.device_class,
+        original_icon=description.icon,
+        original_name=name,
+        suggested_object_id=name,
+        unit_of_measurement=description.native_unit_of_measurement,
+    )
+    return False
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: ConfigEntry,
@@ -94,34 +232,98 @@ async def async_setup_entry(
 ) -> None:
     data = hass.data[DOMAIN][entry.entry_id]
     coordinator: KecoCoordinator = data["coordinator"]
+    # statId -> selected chgerIds; a missing or empty list means every charger.
+    selected: dict[str, list[str]] = entry.options.get(CONF_ENABLED_CHARGERS) or {}
 
-    stat_id = coordinator.station.get(CONF_STAT_ID, "")
-    station_name = coordinator.station.get(CONF_STAT_NM, stat_id)
+    entities: list[SensorEntity] = []
+    for view in data["stations"]:
+        entities.extend(_async_station_entities(hass, entry, coordinator, view, selected.get(view.stat_id)))
+    entities.extend(_async_key_entities(hass, entry, coordinator, data["stations"]))
+
+    async_add_entities(entities)
 
-    selected = entry.options.get(CONF_ENABLED_CHARGERS, [])
+
+@callback
+def _async_key_entities(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    coordinator: KecoCoordinator,
+    views: list[KecoStationView],
+) -> list[SensorEntity]:
+    """Sensors of the whole API key (poll interval, request stats).
+
+    One set per key, made by the owning entry (async_key_sensor_owner) on its
+    first station's device, with unique_ids scoped to the key.
+    """
+    registry = er.async_get(hass)
+    # Earlier versions made these per station; drop those registry entries.
+    for view in views:
+        for suffix in ("update_interval", *(desc.key for desc in API_STATS_TYPES)):
+            entity_id = registry.async_get_entity_id("sensor", DOMAIN, f"{entry.entry_id}_{view.stat_id}_{suffix}")
+            if entity_id is not None:
+                registry.async_remove(entity_id)
+
+    if not views or async_key_sensor_owner(hass, entry.data[CONF_API_KEY]) != entry.entry_id:
+        return []
+    view = views[0]
+    entities: list[SensorEntity] = [KecoUpdateIntervalSensor(coordinator=coordinator, view=view)]
+    for desc in API_STATS_TYPES:
+        if _async_lazy_enabled(
+            hass,
+            entry,
+            f"key_{coordinator.key_id}_{desc.key}",
+            f"KECO {desc.name}",
+            desc,
+            _station_device_info(view),
+        ):
+            entities.append(KecoApiStatsSensor(coordinator=coordinator, view=view, description=desc))
+    return entities
+
+
+@callback
+def _async_station_entities(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    coordinator: KecoCoordinator,
+    view: KecoStationView,
+    selected: list[str] | None,
+) -> list[SensorEntity]:
+    stat_id = view.stat_id
     selected_ids = {str(x) for x in selected} if selected else None
 
-    entities: list[KecoChargerSensor] = []
+    entities: list[SensorEntity] = [
+        KecoStationSensor(coordinator=coordinator, view=view, entry_id=entry.entry_id, description=desc)
+        for desc in STATION_SENSOR_TYPES
+    ]
+    entities.extend(
+        KecoHistorySensor(coordinator=coordinator, view=view, entry_id=entry.entry_id, description=desc)
+        for desc in HISTORY_SENSOR_TYPES
+    )
     for charger in coordinator.data.get(stat_id, []):
-        chger_id = str(charger.get("chgerId", ""))
-        if not chger_id:
-            continue
+        chger_id = charger.chger_id
         if selected_ids is not None and chger_id not in selected_ids:
             continue
 
         for desc in SENSOR_TYPES:
+            if not desc.enabled_default and not _async_lazy_enabled(
+                hass,
+                entry,
+                f"{entry.entry_id}_{stat_id}_{chger_id}_{desc.key}",
+                f"{view.name} {chger_id} {desc.name}",
+                desc,
+                _charger_device_info(view.name, stat_id, chger_id, charger),
+            ):
+                continue
             entities.append(
                 KecoChargerSensor(
                     coordinator=coordinator,
+                    view=view,
                     entry_id=entry.entry_id,
-                    station_name=station_name,
-                    stat_id=stat_id,
                     chger_id=chger_id,
                     description=desc,
                 )
             )
-
-    async_add_entities(entities)
+    return entities
 
 
 class KecoChargerSensor(CoordinatorEntity[KecoCoordinator], SensorEntity):
@@ -131,59 +333,225 @@ class KecoChargerSensor(CoordinatorEntity[KecoCoordinator], SensorEntity):
         self,
         *,
         coordinator: KecoCoordinator,
+        view: KecoStationView,
         entry_id: str,
-        station_name: str,
-        stat_id: str,
         chger_id: str,
         description: KecoSensorDescription,
     ) -> None:
         super().__init__(coordinator)
         self.entity_description = description
-        self._stat_id = stat_id
+        self._view = view
         self._chger_id = chger_id
-        self._station_name = station_name
-        self._attr_unique_id = f"{entry_id}_{stat_id}_{chger_id}_{description.key}"
-        self._attr_name = f"{station_name} {chger_id} {description.name}"
+        self._attr_unique_id = f"{entry_id}_{view.stat_id}_{chger_id}_{description.key}"
+        self._attr_name = f"{view.name} {chger_id} {description.name}"
         self._attr_entity_registry_enabled_default = description.enabled_default
+        # (available, native_value, extra_state_attributes) as last written.
+        self._written: tuple[Any, ...] | None = None
+
+    def _snapshot(self) -> tuple[Any, ...]:
+        return (self.available, self.native_value, self.extra_state_attributes)
+
+    async def async_added_to_hass(self) -> None:
+        await super().async_added_to_hass()
+        self._written = self._snapshot()
+
+    @property
+    def available(self) -> bool:
+        return super().available and self._view.available
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        coordinator = self.coordinator
+        # Unchanged charger row and availability: nothing this entity renders can differ.
+        if (
+            self._written is not None
+            and self._written[0] == self.available
+            and self._chger_id not in self._view.changed_chger_ids
+        ):
+            coordinator.state_writes_skipped += 1
+            return
+        profiler = coordinator.profiler
+        snapshot = profiler.timed("render.charger", self._snapshot) if profiler.enabled else self._snapshot()
+        if snapshot == self._written:
+            coordinator.state_writes_skipped += 1
+            return
+        self._written = snapshot
+        coordinator.state_writes += 1
+        if profiler.enabled:
+            profiler.timed("render.write", self.async_write_ha_state)
+        else:
+            self.async_write_ha_state()
 
     @property
     def native_value(self):
         row = self._charger_row
-        if not row:
+        if row is None:
             return None
         return self.entity_description.value_fn(row)
 
     @property
     def extra_state_attributes(self):
         row = self._charger_row
-        if not row:
+        if row is None:
             return None
         return {
-            "statId": row.get("statId"),
-            "chgerId": row.get("chgerId"),
-            "statNm": row.get("statNm"),
-            "addr": row.get("addr"),
-            "busiNm": row.get("busiNm"),
-            "chgerType": row.get("chgerType"),
-            "output": row.get("output"),
-            "method": row.get("method"),
+            "statId": row.stat_id,
+            "chgerId": row.chger_id,
+            "statNm": row.stat_nm,
+            "addr": row.addr,
+            "busiNm": row.busi_nm,
+            "chgerType": row.chger_type,
+            "output": row.output,
+            "method": row.method,
         }
 
     @property
     def device_info(self):
-        row = self._charger_row or {}
+        return _charger_device_info(self._view.name, self._view.stat_id, self._chger_id, self._charger_row)
+
+    @property
+    def _charger_row(self) -> ChargerState | None:
+        return self._view.rows_by_chger_id.get(self._chger_id)
+
+
+def _charger_device_info(
+    station_name: str, stat_id: str, chger_id: str, row: ChargerState | None
+) -> dict[str, Any]:
+    return {
+        "identifiers": {(DOMAIN, f"{stat_id}_{chger_id}")},
+        "name": f"{station_name} #{chger_id}",
+        "manufacturer": (row.busi_nm if row is not None else "") or "공공충전인프라",
+        "model": "KECO EV Charger",
+        "suggested_area": "EV",
+    }
+
+
+def _station_device_info(view: KecoStationView) -> dict[str, Any]:
+    return {
+        "identifiers": {(DOMAIN, view.stat_id)},
+        "name": view.name,
+        "manufacturer": view.station.get(CONF_BUSI_NM) or "공공충전인프라",
+        "model": "KECO EV Charging Station",
+        "suggested_area": "EV",
+    }
+
+
+class KecoStationSensor(CoordinatorEntity[KecoCoordinator], SensorEntity):
+    entity_description: KecoStationSensorDescription
+
+    def __init__(
+        self,
+        *,
+        coordinator: KecoCoordinator,
+        view: KecoStationView,
+        entry_id: str,
+        description: KecoStationSensorDescription,
+    ) -> None:
+        super().__init__(coordinator)
+        self.entity_description = description
+        self._view = view
+        self._attr_unique_id = f"{entry_id}_{view.stat_id}_{description.key}"
+        self._attr_name = f"{view.name} {description.name}"
+        self._attr_device_info = _station_device_info(view)
+        self._written: tuple[Any, ...] | None = None
+
+    async def async_added_to_hass(self) -> None:
+        await super().async_added_to_hass()
+        self._written = self._snapshot()
+
+    @property
+    def available(self) -> bool:
+        return super().available and self._view.available
+
+    def _snapshot(self) -> tuple[Any, ...]:
+        return (self.available, self.native_value)
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        profiler = self.coordinator.profiler
+        snapshot = profiler.timed("render.station", self._snapshot) if profiler.enabled else self._snapshot()
+        if snapshot == self._written:
+            self.coordinator.state_writes_skipped += 1
+            return
+        self._written = snapshot
+        self.coordinator.state_writes += 1
+        if profiler.enabled:
+            profiler.timed("render.write", self.async_write_ha_state)
+        else:
+            self.async_write_ha_state()
+
+    @property
+    def native_value(self):
+        return self.entity_description.value_fn(self._view.summary)
+
+
+class KecoHistorySensor(KecoStationSensor):
+    entity_description: KecoHistorySensorDescription
+
+    @property
+    def native_value(self):
+        history = self._view.history
+        if history is None:
+            return None
+        return self.entity_description.value_fn(history.summary(HISTORY_SENSOR_DAYS))
+
+    @property
+    def extra_state_attributes(self):
+        return {"days": HISTORY_SENSOR_DAYS}
+
+
+class KecoUpdateIntervalSensor(CoordinatorEntity[KecoCoordinator], SensorEntity):
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_device_class = "duration"
+    _attr_native_unit_of_measurement = "s"
+    _attr_icon = "mdi:timer-sync-outline"
+
+    def __init__(
+        self,
+        *,
+        coordinator: KecoCoordinator,
+        view: KecoStationView,
+    ) -> None:
+        super().__init__(coordinator)
+        self._attr_unique_id = f"key_{coordinator.key_id}_update_interval"
+        self._attr_name = "KECO 갱신 주기"
+        self._attr_device_info = _station_device_info(view)
+
+    @property
+    def native_value(self):
+        interval = self.coordinator.update_interval
+        return int(interval.total_seconds()) if interval else None
+
+    @property
+    def extra_state_attributes(self):
+        budget = self.coordinator.budget
+        if budget is None:
+            return None
         return {
-            "identifiers": {(DOMAIN, f"{self._stat_id}_{self._chger_id}")},
-            "name": f"{self._station_name} #{self._chger_id}",
-            "manufacturer": row.get("busiNm") or "공공충전인프라",
-            "model": "KECO EV Charger",
-            "suggested_area": "EV",
+            "daily_request_budget": budget.daily_budget,
+            "requests_today": budget.client.stats.requests_today,
         }
 
+
+class KecoApiStatsSensor(CoordinatorEntity[KecoCoordinator], SensorEntity):
+    entity_description: KecoApiStatsDescription
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
+
+    def __init__(
+        self,
+        *,
+        coordinator: KecoCoordinator,
+        view: KecoStationView,
+        description: KecoApiStatsDescription,
+    ) -> None:
+        super().__init__(coordinator)
+        self.entity_description = description
+        self._view = view
+        self._attr_unique_id = f"key_{coordinator.key_id}_{description.key}"
+        self._attr_name = f"KECO {description.name}"
+        self._attr_device_info = _station_device_info(view)
+
     @property
-    def _charger_row(self) -> dict[str, Any] | None:
-        rows = self.coordinator.data.get(self._stat_id, [])
-        for row in rows:
-            if str(row.get("chgerId", "")) == self._chger_id:
-                return row
-        return None
+    def native_value(self):
+        return self.entity_description.value_fn(self.coordinator.client)
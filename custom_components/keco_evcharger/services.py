@@ -0,0 +1,227 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+import voluptuous as vol
+from homeassistant.const import ATTR_LATITUDE, ATTR_LONGITUDE
+from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse, SupportsResponse
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers import config_validation as cv
+
+from .api import PRIORITY_INTERACTIVE, KecoApiClient
+from .const import (
+    CONF_ADDR,
+    CONF_STAT_ID,
+    CONF_STAT_NM,
+    CONF_ZCODE,
+    DATA_CLIENTS,
+    DOMAIN,
+    EXPORT_FORMATS,
+    HISTORY_SENSOR_DAYS,
+    NEARBY_MAX_STATIONS,
+    RESPONSE_CACHE_TTL,
+    STATION_FETCH_CONCURRENCY,
+    ZCODE_OPTIONS,
+)
+from .coordinator import KecoCoordinator, KecoStationView
+from .export import async_export_zones
+from .models import STAT_AVAILABLE, ChargerState
+from .profiling import async_profile_cycles
+
+SERVICE_CHARGER_STATISTICS = "charger_statistics"
+SERVICE_EXPORT_ZONES = "export_zones"
+SERVICE_SET_PROFILING = "set_profiling"
+SERVICE_PROFILE_CYCLES = "profile_cycles"
+SERVICE_NEAREST_FREE_CHARGERS = "nearest_free_chargers"
+
+ATTR_STAT_ID = "stat_id"
+ATTR_CHGER_ID = "chger_id"
+ATTR_DAYS = "days"
+ATTR_COUNT = "count"
+ATTR_RADIUS_KM = "radius_km"
+ATTR_FORMAT = "format"
+ATTR_RESUME = "resume"
+ATTR_ENABLED = "enabled"
+ATTR_CYCLES = "cycles"
+
+CHARGER_STATISTICS_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_STAT_ID): cv.string,
+        vol.Optional(ATTR_CHGER_ID): vol.All(cv.ensure_list, [cv.string]),
+        vol.Optional(ATTR_DAYS, default=HISTORY_SENSOR_DAYS): vol.All(vol.Coerce(float), vol.Range(min=1, max=90)),
+    }
+)
+
+NEAREST_FREE_CHARGERS_SCHEMA = vol.Schema(
+    {
+        vol.Inclusive(ATTR_LATITUDE, "location"): cv.latitude,
+        vol.Inclusive(ATTR_LONGITUDE, "location"): cv.longitude,
+        vol.Optional(CONF_ZCODE): cv.string,
+        vol.Optional(ATTR_COUNT, default=5): vol.All(vol.Coerce(int), vol.Range(min=1, max=50)),
+        vol.Optional(ATTR_RADIUS_KM, default=10): vol.All(vol.Coerce(float), vol.Range(min=0.1, max=100)),
+    }
+)
+
+# Without zcode every region is exported.
+EXPORT_ZONES_SCHEMA = vol.Schema(
+    {
+        vol.Optional(CONF_ZCODE): vol.All(cv.ensure_list, [vol.In(ZCODE_OPTIONS)]),
+        vol.Optional(ATTR_FORMAT, default=EXPORT_FORMATS[0]): vol.In(EXPORT_FORMATS),
+        vol.Optional(ATTR_RESUME, default=True): cv.boolean,
+    }
+)
+
+# Without `enabled` the entry options decide again.
+SET_PROFILING_SCHEMA = vol.Schema({vol.Optional(ATTR_ENABLED): cv.boolean})
+
+PROFILE_CYCLES_SCHEMA = vol.Schema(
+    {vol.Optional(ATTR_CYCLES, default=3): vol.All(vol.Coerce(int), vol.Range(min=1, max=20))}
+)
+
+
+def _coordinators(hass: HomeAssistant) -> list[KecoCoordinator]:
+    slots = hass.data.get(DOMAIN, {}).get(DATA_CLIENTS, {}).values()
+    return [slot["coordinator"] for slot in slots if "coordinator" in slot]
+
+
+def _station_view(hass: HomeAssistant, stat_id: str) -> KecoStationView:
+    for coordinator in _coordinators(hass):
+        if stat_id in coordinator.stations:
+            return coordinator.stations[stat_id]
+    raise ServiceValidationError(f"Station {stat_id} is not configured")
+
+
+async def _async_free_chargers(
+    hass: HomeAssistant, client: KecoApiClient, stat_id: str
+) -> list[ChargerState]:
+    try:
+        rows = list(_station_view(hass, stat_id).rows_by_chger_id.values())
+    except ServiceValidationError:
+        # Not configured: one getChargerInfo request, shared with the response cache.
+        raw_rows = await client.get_station_chargers(
+            stat_id, cache=True, max_age=RESPONSE_CACHE_TTL, stale_ok=True, priority=PRIORITY_INTERACTIVE
+        )
+        rows = [ChargerState.from_row(row) for row in raw_rows]
+    return [row for row in rows if row.stat == STAT_AVAILABLE]
+
+
+def async_setup_services(hass: HomeAssistant) -> None:
+    async def async_charger_statistics(call: ServiceCall) -> ServiceResponse:
+        # Answered from the in-memory history; the recorder is not queried.
+        view = _station_view(hass, call.data[ATTR_STAT_ID])
+        days = call.data[ATTR_DAYS]
+        chargers = view.history.statistics(days, call.data.get(ATTR_CHGER_ID)) if view.history else {}
+        return {"stat_id": view.stat_id, "days": days, "chargers": chargers}
+
+    async def async_nearest_free_chargers(call: ServiceCall) -> ServiceResponse:
+        # Imported here: the package imports this module during setup.
+        from . import async_get_catalog
+
+        coordinators = _coordinators(hass)
+        if not coordinators:
+            raise ServiceValidationError("No KECO EV Charger stations are configured")
+        lat = call.data.get(ATTR_LATITUDE, hass.config.latitude)
+        lng = call.data.get(ATTR_LONGITUDE, hass.config.longitude)
+        zcodes = (
+            [call.data[CONF_ZCODE]]
+            if CONF_ZCODE in call.data
+            else sorted(
+                {
+                    view.station[CONF_ZCODE]
+                    for coordinator in coordinators
+                    for view in coordinator.stations.values()
+                    if view.station.get(CONF_ZCODE)
+                }
+            )
+        )
+        client = coordinators[0].client
+        nearest = await async_get_catalog(hass).async_nearest(client, zcodes, lat, lng, call.data[ATTR_RADIUS_KM])
+
+        # Stations come off the spatial index nearest first; their live status is
+        # checked a few at a time until enough free chargers are found.
+        found: list[dict[str, Any]] = []
+        checked = 0
+        while len(found) < call.data[ATTR_COUNT] and checked < NEARBY_MAX_STATIONS:
+            batch = [item for _, item in zip(range(STATION_FETCH_CONCURRENCY), nearest)]
+            if not batch:
+                break
+            checked += len(batch)
+            free = await asyncio.gather(
+                *(_async_free_chargers(hass, client, station[CONF_STAT_ID]) for _, station in batch),
+                return_exceptions=True,
+            )
+            for (dist, station), rows in zip(batch, free):
+                if isinstance(rows, Exception):
+                    continue
+                found.extend(
+                    {
+                        "stat_id": row.stat_id,
+                        "stat_nm": station[CONF_STAT_NM],
+                        "addr": station[CONF_ADDR],
+                        "chger_id": row.chger_id,
+                        "chger_type": row.chger_type,
+                        "output": row.output,
+                        "distance_km": round(dist, 2),
+                    }
+                    for row in rows
+                )
+        return {"chargers": found[: call.data[ATTR_COUNT]], "stations_checked": checked}
+
+    async def async_export_zones_service(call: ServiceCall) -> ServiceResponse:
+        coordinators = _coordinators(hass)
+        if not coordinators:
+            raise ServiceValidationError("No KECO EV Charger stations are configured")
+        zcodes = call.data.get(CONF_ZCODE) or list(ZCODE_OPTIONS)
+        zones = await async_export_zones(
+            hass, coordinators[0].client, zcodes, call.data[ATTR_FORMAT], call.data[ATTR_RESUME]
+        )
+        return {"zones": zones}
+
+    async def async_set_profiling(call: ServiceCall) -> ServiceResponse:
+        coordinators = _coordinators(hass)
+        for coordinator in coordinators:
+            coordinator.profiler.set_override(call.data.get(ATTR_ENABLED))
+        return {"profilers": [coordinator.profiler.as_dict() for coordinator in coordinators]}
+
+    async def async_profile_cycles_service(call: ServiceCall) -> ServiceResponse:
+        coordinators = _coordinators(hass)
+        if not coordinators:
+            raise ServiceValidationError("No KECO EV Charger stations are configured")
+        return await async_profile_cycles(hass, coordinators, call.data[ATTR_CYCLES])
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_NEAREST_FREE_CHARGERS,
+        async_nearest_free_chargers,
+        schema=NEAREST_FREE_CHARGERS_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_CHARGER_STATISTICS,
+        async_charger_statistics,
+        schema=CHARGER_STATISTICS_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_EXPORT_ZONES,
+        async_export_zones_service,
+        schema=EXPORT_ZONES_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SET_PROFILING,
+        async_set_profiling,
+        schema=SET_PROFILING_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_PROFILE_CYCLES,
+        async_profile_cycles_service,
+        schema=PROFILE_CYCLES_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
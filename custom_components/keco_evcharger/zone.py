@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import asyncio
+import math
+import time
+from typing import Any
+
+from .api import KecoApiClient
+from .const import (
+    DEFAULT_UPDATE_INTERVAL,
+    FULL_RESYNC_INTERVAL,
+    STATUS_DELTA_MAX_PERIOD,
+    ZONE_PAGE_SIZE,
+    ZONE_POLL_MIN_STATIONS,
+)
+
+
+# Shared per API key: fetches each zone's getChargerStatus rows once per cycle and
+# fans them out to the station coordinators through a statId index.
+class KecoZonePoller:
+    def __init__(self, client: KecoApiClient, update_interval: int = DEFAULT_UPDATE_INTERVAL) -> None:
+        self.client = client
+        # Coordinators tick at different offsets within the same interval. A zone
+        # fetch younger than this is reused, so each zone is fetched about once per cycle.
+        self._max_age = max(30.0, update_interval - 30.0)
+        self._stations: dict[str, set[str]] = {}
+        # zcode -> statId -> chgerId -> latest status row
+        self._index: dict[str, dict[str, dict[str, dict[str, Any]]]] = {}
+        self._fetched_at: dict[str, float] = {}
+        self._full_synced_at: dict[str, float] = {}
+        # zcode -> pages of the full status feed; see ZONE_POLL_MIN_STATIONS.
+        self._pages: dict[str, int] = {}
+        self._locks: dict[str, asyncio.Lock] = {}
+
+    def register(self, zcode: str, stat_id: str) -> None:
+        self._stations.setdefault(zcode, set()).add(stat_id)
+
+    def unregister(self, zcode: str, stat_id: str) -> None:
+        stations = self._stations.get(zcode)
+        if stations is None:
+            return
+        stations.discard(stat_id)
+        self._index.get(zcode, {}).pop(stat_id, None)
+        if not stations:
+            self._stations.pop(zcode, None)
+            self._index.pop(zcode, None)
+            self._fetched_at.pop(zcode, None)
+            self._full_synced_at.pop(zcode, None)
+            self._pages.pop(zcode, None)
+            self._locks.pop(zcode, None)
+
+    def is_polled(self, zcode: str) -> bool:
+        stations = len(self._stations.get(zcode, ()))
+        pages = self._pages.get(zcode)
+        return pages is not None and stations >= max(ZONE_POLL_MIN_STATIONS, pages)
+
+    def has_polled_zones(self) -> bool:
+        return any(self.is_polled(zcode) for zcode in self._stations)
+
+    async def async_is_polled(self, zcode: str) -> bool:
+        """is_polled(), first asking upstream for the zone's page count if unknown."""
+        if len(self._stations.get(zcode, ())) < ZONE_POLL_MIN_STATIONS:
+            return False
+        if zcode not in self._pages:
+            async with self._locks.setdefault(zcode, asyncio.Lock()):
+                if zcode not in self._pages:
+                    try:
+                        total = await self.client.get_zone_status_count(zcode)
+                    except Exception:  # noqa: BLE001
+                        # Stations are fetched one by one; asked again next cycle.
+                        return False
+                    self._pages[zcode] = max(1, math.ceil(total / ZONE_PAGE_SIZE))
+        return self.is_polled(zcode)
+
+    async def async_get_station_status(
+        self, zcode: str, stat_id: str, max_age: float | None = None
+    ) -> list[dict[str, Any]]:
+        # Coordinators polling faster than the default cycle pass a shorter max_age.
+        max_age = self._max_age if max_age is None else min(max_age, self._max_age)
+        lock = self._locks.setdefault(zcode, asyncio.Lock())
+        async with lock:
+            fetched_at = self._fetched_at.get(zcode)
+            if fetched_at is None or time.monotonic() - fetched_at >= max_age:
+                await self._async_refresh_zone(zcode)
+        return list(self._index.get(zcode, {}).get(stat_id, {}).values())
+
+    async def _async_refresh_zone(self, zcode: str) -> None:
+        now = time.monotonic()
+        fetched_at = self._fetched_at.get(zcode)
+        full_at = self._full_synced_at.get(zcode)
+
+        # Delta feed only works if it covers the whole gap since the previous fetch.
+        period = None
+        if fetched_at is not None and full_at is not None and now - full_at < FULL_RESYNC_INTERVAL:
+            gap_minutes = math.ceil((now - fetched_at) / 60) + 1
+            if gap_minutes <= STATUS_DELTA_MAX_PERIOD:
+                period = gap_minutes
+
+        rows = await self.client.get_zone_status(zcode, period=period)
+        wanted = self._stations.get(zcode, set())
+        if period is None:
+            index: dict[str, dict[str, dict[str, Any]]] = {}
+            self._full_synced_at[zcode] = now
+            self._pages[zcode] = max(1, math.ceil(len(rows) / ZONE_PAGE_SIZE))
+        else:
+            index = self._index.setdefault(zcode, {})
+
+        for row in rows:
+            stat_id = str(row.get("statId", "")).strip()
+            chger_id = str(row.get("chgerId", "")).strip()
+            if stat_id in wanted and chger_id:
+                index.setdefault(stat_id, {})[chger_id] = row
+
+        self._index[zcode] = index
+        self._fetched_at[zcode] = now
@@ -0,0 +1,49 @@
+"""Coalesced KecoApiClient requests against MockKecoServer.
+
+Run from the repository root with Home Assistant installed:
+
+    python -m unittest discover tests
+"""
+from __future__ import annotations
+
+import asyncio
+import unittest
+
+from benchmarks.mock_keco import MockConfig, MockKecoServer
+from custom_components.keco_evcharger.api import KecoApiClient
+
+
+class CoalescingTest(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        self.server = MockKecoServer(MockConfig(stations=5, latency=0.2))
+        self.client = KecoApiClient("test", http_client=self.server.client())
+        self.stat_id = self.server.stat_ids[0]
+
+    async def asyncTearDown(self) -> None:
+        await self.client.async_close()
+
+    async def test_cancelled_leader_does_not_cancel_followers(self) -> None:
+        leader = asyncio.create_task(self.client.get_station_chargers(self.stat_id))
+        await asyncio.sleep(0.05)
+        follower = asyncio.create_task(self.client.get_station_chargers(self.stat_id))
+        await asyncio.sleep(0.05)
+        leader.cancel()
+
+        rows = await follower
+        self.assertTrue(leader.cancelled())
+        self.assertTrue(rows)
+        self.assertEqual(self.server.requests, 1)
+        self.assertEqual(self.client.stats.coalesced, 1)
+
+    async def test_request_finishes_without_waiters(self) -> None:
+        leader = asyncio.create_task(self.client.get_station_chargers(self.stat_id))
+        await asyncio.sleep(0.05)
+        leader.cancel()
+        await asyncio.sleep(0.3)
+
+        self.assertEqual(self.server.requests, 1)
+        self.assertEqual(self.client._inflight, {})
+
+
+if __name__ == "__main__":
+    unittest.main()
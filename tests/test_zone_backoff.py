@@ -0,0 +1,111 @@
+"""Idle backoff of a zone-polled API key against MockKecoServer.
+
+Run from the repository root with Home Assistant installed:
+
+    python -m unittest discover tests
+"""
+from __future__ import annotations
+
+import tempfile
+from types import SimpleNamespace
+import unittest
+
+from homeassistant.core import HomeAssistant
+
+from benchmarks.mock_keco import MockConfig, MockKecoServer
+from custom_components.keco_evcharger.api import KecoApiClient
+from custom_components.keco_evcharger.const import (
+    CONF_STAT_ID,
+    CONF_STAT_NM,
+    CONF_STATIONS,
+    CONF_ZCODE,
+    MAX_UPDATE_INTERVAL,
+    ZONE_PAGE_SIZE,
+    ZONE_POLL_MAX_INTERVAL,
+)
+from custom_components.keco_evcharger.coordinator import KecoCoordinator
+from custom_components.keco_evcharger.zone import KecoZonePoller
+
+
+class ZoneBackoffTest(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        self._config_dir = tempfile.TemporaryDirectory()
+        self.hass = HomeAssistant(self._config_dir.name)
+        config = MockConfig(stations=20, status_change_rate=0.0)
+        self.server = MockKecoServer(config)
+        # Nothing charging or changing, so the coordinator backs off.
+        for row in self.server.rows:
+            row["stat"] = "2"
+        self.client = KecoApiClient("test", http_client=self.server.client())
+        self.poller = KecoZonePoller(self.client)
+        self.coordinator = KecoCoordinator(self.hass, self.client, zone_poller=self.poller)
+        self.entry = SimpleNamespace(
+            entry_id="backoff",
+            data={
+                CONF_STATIONS: [
+                    {CONF_STAT_ID: stat_id, CONF_STAT_NM: stat_id, CONF_ZCODE: config.zcode}
+                    for stat_id in self.server.stat_ids[:5]
+                ]
+            },
+            options={},
+        )
+
+        self.periods: list[int | None] = []
+        get_zone_status = self.client.get_zone_status
+
+        async def record_period(zcode: str, period: int | None = None):
+            self.periods.append(period)
+            return await get_zone_status(zcode, period=period)
+
+        self.client.get_zone_status = record_period
+
+    async def asyncTearDown(self) -> None:
+        await self.coordinator.async_remove_entry(self.entry.entry_id)
+        await self.client.async_close()
+        await self.hass.async_stop(force=True)
+        self._config_dir.cleanup()
+
+    async def _cycle(self) -> None:
+        # Age the zone fetch by the interval the coordinator picked instead of sleeping.
+        gap = self.coordinator.update_interval.total_seconds()
+        for zcode in list(self.poller._fetched_at):
+            self.poller._fetched_at[zcode] -= gap
+        self.coordinator.data = await self.coordinator._async_update_data()
+
+    async def test_backed_off_cycles_use_delta(self) -> None:
+        await self.coordinator.async_add_entry(self.entry)
+        for _ in range(8):
+            await self._cycle()
+
+        self.assertTrue(self.poller.has_polled_zones())
+        interval = self.coordinator.update_interval.total_seconds()
+        self.assertEqual(interval, ZONE_POLL_MAX_INTERVAL)
+        self.assertLess(interval, MAX_UPDATE_INTERVAL)
+        # The first zone fetch is the full download; every later one is a delta.
+        self.assertIsNone(self.periods[0])
+        self.assertGreater(len(self.periods), 1)
+        self.assertTrue(all(period is not None for period in self.periods[1:]), self.periods)
+
+    async def test_zone_with_more_pages_than_stations_is_not_polled(self) -> None:
+        # 5 stations, but the zone's full status feed spans 6 pages.
+        self.server.rows.extend({**self.server.rows[0], "statId": "ZZ000000"} for _ in range(5 * ZONE_PAGE_SIZE))
+        await self.coordinator.async_add_entry(self.entry)
+        for _ in range(3):
+            await self._cycle()
+
+        self.assertFalse(self.poller.has_polled_zones())
+        self.assertEqual(self.periods, [])
+
+    async def test_station_polled_key_backs_off_fully(self) -> None:
+        self.entry.data[CONF_STATIONS] = self.entry.data[CONF_STATIONS][:1]
+        await self.coordinator.async_add_entry(self.entry)
+        for _ in range(8):
+            await self._cycle()
+
+        self.assertFalse(self.poller.has_polled_zones())
+        self.assertEqual(self.coordinator.update_interval.total_seconds(), MAX_UPDATE_INTERVAL)
+        self.assertEqual(self.periods, [])
+
+
+if __name__ == "__main__":
+    unittest.main()